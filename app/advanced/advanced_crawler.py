@@ -7,15 +7,38 @@ including sub-page navigation, multi-tab handling, and sophisticated data extrac
 """
 
 import asyncio
-import json
 import logging
-from typing import List, Dict, Any, Optional, Set
+import orjson
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Union
+from collections import defaultdict
 from dataclasses import dataclass
+from urllib.parse import SplitResult, urlsplit
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from app.core.browser_pool import BrowserPool
 from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _split(url: str) -> SplitResult:
+    """Split a URL, memoized since the same page URLs are checked repeatedly"""
+    return urlsplit(url)
+
+
+# Firefox preferences for every browser the crawler runs in
+FIREFOX_USER_PREFS = {
+    "dom.webdriver.enabled": False,
+    "useAutomationExtension": False,
+}
+
+# Options for every context the crawler opens, including pooled ones
+FIREFOX_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 800},
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ExtractionResult:
     data: Dict[str, Any]
     source_url: str
@@ -23,7 +46,7 @@ class ExtractionResult:
     workflow_path: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NavigationState:
     current_url: str
     page_number: int
@@ -32,38 +55,66 @@ class NavigationState:
 
 
 class AdvancedCrawler:
-    def __init__(self, config: CrawlerConfiguration, headless: bool = True):
+    # Substrings that mark a control as disabled; "disabled" and "inactive"
+    # also cover "btn-disabled" and "btn-inactive"
+    _DISABLED_CLASS_MARKERS = ("disabled", "inactive", "not-clickable")
+
+    def __init__(
+        self,
+        config: CrawlerConfiguration,
+        headless: bool = True,
+        browser: Optional[Browser] = None,
+        pool: Optional[BrowserPool] = None,
+    ):
         self.config = config
         self.headless = headless
-        self.browser: Optional[Browser] = None
+        self.pool = pool
+        # A caller-supplied browser is shared; only close what we launched
+        self.browser: Optional[Browser] = browser
+        self._owns_browser = browser is None and pool is None
+        self.playwright = None
         self.context: Optional[BrowserContext] = None
         self.main_page: Optional[Page] = None
         self.data: List[ExtractionResult] = []
         self.navigation_history: List[NavigationState] = []
         self.visited_urls: Set[str] = set()
 
+        # Index selections once; the first selection wins on duplicate names
+        self._selection_by_name: Dict[str, ElementSelection] = {}
+        self._selections_by_type: Dict[str, List[ElementSelection]] = defaultdict(list)
+        for selection in config.selections:
+            self._selection_by_name.setdefault(selection.name, selection)
+            self._selections_by_type[selection.element_type].append(selection)
+        self._items_selector: Optional[ElementSelection] = next(
+            iter(self._selections_by_type["items_container"]), None
+        )
+
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.firefox.launch(
-            headless=self.headless,
-            firefox_user_prefs={
-                "dom.webdriver.enabled": False,
-                "useAutomationExtension": False,
-            },
-        )
-        self.context = await self.browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0",
-        )
+        if self.pool:
+            # Borrow a warm context instead of launching a browser
+            self.context = await self.pool.acquire()
+        else:
+            if self._owns_browser:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.firefox.launch(
+                    headless=self.headless, firefox_user_prefs=FIREFOX_USER_PREFS
+                )
+            self.context = await self.browser.new_context(**FIREFOX_CONTEXT_OPTIONS)
         self.main_page = await self.context.new_page()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.pool and self.context:
+            await self.pool.release(self.context)
+            self.context = None
+            return
         if self.context:
             await self.context.close()
+        if not self._owns_browser:
+            return
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -168,10 +219,7 @@ class AdvancedCrawler:
         item_data = {}
         current_url = self.main_page.url
 
-        for selection in self.config.selections:
-            if selection.element_type != "data_field":
-                continue
-
+        for selection in self._selections_by_type["data_field"]:
             # Skip fields that belong to other pages (workflow-only fields)
             # These will be extracted during workflow execution
             field_page_url = getattr(selection, "page_url", None)
@@ -756,17 +804,11 @@ class AdvancedCrawler:
 
     def _find_selection_by_name(self, name: str) -> Optional[ElementSelection]:
         """Find a selection configuration by name"""
-        for selection in self.config.selections:
-            if selection.name == name:
-                return selection
-        return None
+        return self._selection_by_name.get(name)
 
     def _get_items_selector(self) -> Optional[ElementSelection]:
         """Get the items container selector"""
-        for selection in self.config.selections:
-            if selection.element_type == "items_container":
-                return selection
-        return None
+        return self._items_selector
 
     async def _is_element_clickable(self, element) -> bool:
         """
@@ -774,31 +816,27 @@ class AdvancedCrawler:
         Checks for various disabled states and visibility issues.
         """
         try:
+            # Fetch the attribute-based indicators in one concurrent batch
+            is_disabled, aria_disabled, class_name = await asyncio.gather(
+                element.get_attribute("disabled"),
+                element.get_attribute("aria-disabled"),
+                element.get_attribute("class"),
+            )
+
             # Check disabled attribute
-            is_disabled = await element.get_attribute("disabled")
             if is_disabled is not None:
                 self.logger.info(f"Element is disabled (disabled attribute)")
                 return False
 
             # Check aria-disabled
-            aria_disabled = await element.get_attribute("aria-disabled")
             if aria_disabled == "true":
                 self.logger.info(f"Element is disabled (aria-disabled)")
                 return False
 
             # Check class name for disabled indicators
-            class_name = await element.get_attribute("class") or ""
-            disabled_classes = [
-                "disabled",
-                "btn-disabled",
-                "inactive",
-                "not-clickable",
-                "btn-inactive",
-            ]
-            if any(
-                disabled_class in class_name.lower()
-                for disabled_class in disabled_classes
-            ):
+            class_name = class_name or ""
+            lowered = class_name.lower()
+            if any(marker in lowered for marker in self._DISABLED_CLASS_MARKERS):
                 self.logger.info(f"Element has disabled class: {class_name}")
                 return False
 
@@ -809,10 +847,10 @@ class AdvancedCrawler:
                 return False
 
             # Check computed styles for pointer-events and opacity
-            pointer_events = await element.evaluate(
-                "el => getComputedStyle(el).pointerEvents"
+            pointer_events, opacity = await asyncio.gather(
+                element.evaluate("el => getComputedStyle(el).pointerEvents"),
+                element.evaluate("el => getComputedStyle(el).opacity"),
             )
-            opacity = await element.evaluate("el => getComputedStyle(el).opacity")
 
             if pointer_events == "none":
                 self.logger.info(f"Element has pointer-events: none")
@@ -911,21 +949,28 @@ class AdvancedCrawler:
 
     def _get_base_url(self, url: str) -> str:
         """Extract base URL from full URL for comparison"""
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
+        parsed = _split(url)
         return f"{parsed.scheme}://{parsed.netloc}"
 
-    def _is_field_for_current_page(self, field_page_url: str, current_url: str) -> bool:
+    def _is_field_for_current_page(
+        self,
+        field_page_url: Union[str, SplitResult],
+        current_url: Union[str, SplitResult],
+    ) -> bool:
         """
         Determine if a field belongs to the current page.
         Returns True if the field should be extracted on the current page.
+        Either URL may be passed pre-split to skip parsing.
         """
-        from urllib.parse import urlparse
-
         # Parse both URLs
-        field_parsed = urlparse(field_page_url)
-        current_parsed = urlparse(current_url)
+        field_parsed = (
+            _split(field_page_url)
+            if isinstance(field_page_url, str)
+            else field_page_url
+        )
+        current_parsed = (
+            _split(current_url) if isinstance(current_url, str) else current_url
+        )
 
         # If different domains, definitely different pages
         if field_parsed.netloc != current_parsed.netloc:
@@ -961,7 +1006,9 @@ class AdvancedCrawler:
 
         return await self.crawl_with_workflows()
 
-    def save_results(self, filename: Optional[str] = None, format: str = "json"):
+    def save_results(
+        self, filename: Optional[str] = None, format: str = "json", _opener=open
+    ):
         """Save extraction results to file"""
         if not self.data:
             self.logger.warning("No data to save")
@@ -970,20 +1017,9 @@ class AdvancedCrawler:
         filename = filename or f"advanced_crawl_results.{format}"
 
         if format.lower() == "json":
-            # Convert dataclasses to dicts for JSON serialization
-            serializable_data = []
-            for result in self.data:
-                serializable_data.append(
-                    {
-                        "data": result.data,
-                        "source_url": result.source_url,
-                        "extraction_time": result.extraction_time,
-                        "workflow_path": result.workflow_path,
-                    }
-                )
-
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(serializable_data, f, indent=2, ensure_ascii=False)
+            # orjson encodes the result dataclasses directly as UTF-8
+            with _opener(filename, "wb") as f:
+                f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Results saved to {filename}")
 
@@ -1001,10 +1037,17 @@ class AdvancedCrawler:
 
 
 # Integration function to load configuration from interactive selector
-def load_interactive_config(config_file: str) -> CrawlerConfiguration:
+def _load_json(f) -> Any:
+    # orjson parses the raw bytes, skipping a separate UTF-8 decode
+    return orjson.loads(f.read())
+
+
+def load_interactive_config(
+    config_file: str, _loader=_load_json, _opener=open
+) -> CrawlerConfiguration:
     """Load configuration created by interactive selector"""
-    with open(config_file, "r", encoding="utf-8") as f:
-        config_data = json.load(f)
+    with _opener(config_file, "rb") as f:
+        config_data = _loader(f)
 
     selections = [ElementSelection(**sel) for sel in config_data["selections"]]
     workflows = [WorkflowStep(**wf) for wf in config_data["workflows"]]
@@ -4,10 +4,18 @@ Core crawling functionality
 This package contains the fundamental crawling components:
 - Configuration classes and presets
 - Basic paginated crawler implementation
+- Browser pool for reusing a warm browser across crawls
 - Core data structures and utilities
 """
 
 from .config import SiteConfig, PresetConfigs
 from .crawler import CrawlerConfig, PaginatedCrawler
+from .browser_pool import BrowserPool
 
-__all__ = ["SiteConfig", "PresetConfigs", "CrawlerConfig", "PaginatedCrawler"]
+__all__ = [
+    "SiteConfig",
+    "PresetConfigs",
+    "CrawlerConfig",
+    "PaginatedCrawler",
+    "BrowserPool",
+]
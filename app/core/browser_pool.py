@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+
+class BrowserPool:
+    """
+    Keeps one browser running and hands out pre-warmed browser contexts so
+    repeated crawls skip the browser launch. Contexts are returned with
+    release() and replaced with a fresh one after max_uses acquisitions.
+    Until then cookies and storage carry over between borrowers; use
+    max_uses=1 when every acquire() must get an unused context.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 20,
+        headless: bool = True,
+        browser_type: str = "chromium",
+        launch_options: Optional[Dict[str, Any]] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.browser_type = browser_type
+        self.launch_options = launch_options or {}
+        self.context_options = context_options or {}
+        self.browser: Optional[Browser] = None
+        self._queue: "asyncio.Queue[BrowserContext]" = asyncio.Queue()
+        self._uses: Dict[BrowserContext, int] = {}
+        self._start_lock = asyncio.Lock()
+        # Context lifecycle counters, for checking how well the pool is reused
+        self.stats = {"created": 0, "reused": 0, "destroyed": 0}
+
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self):
+        async with self._start_lock:
+            if self.browser:
+                return
+            self.playwright = await async_playwright().start()
+            launcher = getattr(self.playwright, self.browser_type)
+            self.browser = await launcher.launch(
+                headless=self.headless, **self.launch_options
+            )
+            for _ in range(self.size):
+                await self._queue.put(await self._new_context())
+            self.logger.info(f"Browser pool started with {self.size} contexts")
+
+    async def acquire(self) -> BrowserContext:
+        """Take a warm context, waiting if all of them are in use"""
+        await self.start()
+        context = await self._queue.get()
+        if self._uses[context]:
+            self.stats["reused"] += 1
+        self._uses[context] += 1
+        return context
+
+    async def release(self, context: BrowserContext):
+        """Return a context to the pool, recycling it once it is worn out"""
+        for page in list(context.pages):
+            await page.close()
+
+        if self._uses[context] >= self.max_uses:
+            del self._uses[context]
+            await context.close()
+            self.stats["destroyed"] += 1
+            context = await self._new_context()
+
+        await self._queue.put(context)
+
+    async def close(self):
+        while not self._queue.empty():
+            await self._queue.get_nowait().close()
+            self.stats["destroyed"] += 1
+        self._uses.clear()
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+            await self.playwright.stop()
+
+    async def _new_context(self) -> BrowserContext:
+        context = await self.browser.new_context(**self.context_options)
+        self._uses[context] = 0
+        self.stats["created"] += 1
+        return context
@@ -1,19 +1,28 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SiteConfig:
     name: str
     base_url: str
-    selectors: Dict[str, str]
+    selectors: Mapping[str, str]
     pagination_selector: Optional[str] = None
     max_pages: Optional[int] = None
     delay_ms: int = 1000
 
+    def __post_init__(self):
+        # Presets are cached and shared, so their selectors must be read-only
+        object.__setattr__(self, "selectors", MappingProxyType(dict(self.selectors)))
+
 
 class PresetConfigs:
+    """Ready-made site configurations, each built once and shared"""
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def hacker_news_jobs():
         return SiteConfig(
             name="Hacker News Jobs",
@@ -30,6 +39,7 @@ class PresetConfigs:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def quotes_to_scrape():
         return SiteConfig(
             name="Quotes to Scrape",
@@ -46,6 +56,7 @@ class PresetConfigs:
         )
 
     @staticmethod
+    @lru_cache(maxsize=32)  # Keyed by user input, so keep it bounded
     def reddit_subreddit(subreddit: str):
         return SiteConfig(
             name=f"Reddit - {subreddit}",
@@ -1,50 +1,180 @@
 import asyncio
-import json
 import csv
-from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass
-from playwright.async_api import async_playwright, Page, Browser
+import sys
+import time
+import orjson
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, List, Dict, Any, Mapping, Optional, Callable, Coroutine, Tuple
+from dataclasses import dataclass, field
+from playwright.async_api import (
+    async_playwright,
+    Page,
+    Browser,
+    BrowserContext,
+    Locator,
+    TimeoutError as PlaywrightTimeoutError,
+)
 import logging
-
-
-@dataclass
+from app.core.browser_pool import BrowserPool
+
+
+def run_crawl(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a crawl coroutine to completion, on a uvloop event loop when uvloop
+    is installed (pip install uvloop) and on the default loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+# Runs the field lookups for every matched item in the page, so a whole page
+# costs one round-trip
+_EXTRACT_ITEMS_JS = """
+(items, fields) => items.map((el) =>
+    Object.fromEntries(
+        fields.map(([name, sel]) => [name, el.querySelector(sel)?.textContent ?? null])
+    )
+)
+"""
+
+
+# Returns why an element cannot be clicked, or null when it can
+_UNCLICKABLE_REASON_JS = """
+(el) => {
+    if (el.hasAttribute("disabled")) return "disabled attribute";
+    if (el.getAttribute("aria-disabled") === "true") return "aria-disabled";
+    const className = (el.getAttribute("class") || "").toLowerCase();
+    if (["disabled", "inactive", "not-clickable"].some((c) => className.includes(c)))
+        return `disabled class: ${className}`;
+    const style = getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0 || style.visibility === "hidden")
+        return "not visible";
+    if (style.pointerEvents === "none") return "pointer-events: none";
+    if (parseFloat(style.opacity) < 0.1) return `very low opacity: ${style.opacity}`;
+    return null;
+}
+"""
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson has no deque support; convert only that and reject the rest"""
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _clickable_selector(selector: str) -> str:
+    """
+    Narrow a selector to the visible candidates without the disabled markers
+    _UNCLICKABLE_REASON_JS rejects, so the browser filters them in one query
+    """
+    return (
+        f":is({selector}):visible"
+        ":not([disabled]):not([aria-disabled='true'])"
+        ":not([class*='disabled' i]):not([class*='inactive' i])"
+        ":not([class*='not-clickable' i])"
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class CrawlerConfig:
     base_url: str
-    selectors: Dict[str, str]
+    selectors: Mapping[str, str]
     pagination_selector: Optional[str] = None
     max_pages: Optional[int] = None
-    delay_ms: int = 1000
+    delay_ms: int = 1000  # minimum gap between page requests, in every crawl mode
     headless: bool = False
     output_format: str = "json"  # json, csv
     output_file: str = "crawled_data"
+    max_concurrent_items: int = 16  # items extracted concurrently per page
+    batch_extraction: bool = True  # extract a page with one page.evaluate call
+    max_parallel: int = 3  # browser contexts open at once in crawl_parallel
+    # By default pagination only rules out hidden candidates and ones marked
+    # disabled; it no longer rejects pointer-events: none or near-zero opacity.
+    # Set this to run those computed-style checks before clicking again.
+    strict_clickability: bool = False
+    network_idle_timeout_ms: int = 2000  # cap on the best-effort networkidle wait
+    # (field, selector) pairs for every selector except "items"
+    _field_pairs: Tuple[Tuple[str, str], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Selectors are looked up on every page, so intern them once and
+        # freeze the mapping the pre-built field pairs were derived from
+        selectors = MappingProxyType(
+            {sys.intern(k): sys.intern(v) for k, v in self.selectors.items()}
+        )
+        object.__setattr__(self, "selectors", selectors)
+        object.__setattr__(
+            self,
+            "_field_pairs",
+            tuple((k, v) for k, v in selectors.items() if k != "items"),
+        )
+
+    @property
+    def field_selectors(self) -> Tuple[Tuple[str, str], ...]:
+        """(field, selector) pairs to extract from each item, built once"""
+        return self._field_pairs
 
 
 class PaginatedCrawler:
-    def __init__(self, config: CrawlerConfig):
+    def __init__(self, config: CrawlerConfig, pool: Optional[BrowserPool] = None):
         self.config = config
-        self.data: List[Dict[str, Any]] = []
+        self.pool = pool
+        self.data: Deque[Dict[str, Any]] = deque()
         self.current_page = 1
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self._context: Optional[BrowserContext] = None
+        self._locator_cache: Dict[str, Locator] = {}
+        # Monotonic time before which the next page must not be requested;
+        # time spent extracting a page counts towards its politeness delay
+        self._next_request_at = 0.0
+        self._pagination_selector = (
+            _clickable_selector(config.pagination_selector)
+            if config.pagination_selector
+            else None
+        )
 
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.config.headless
-        )
-        self.page = await self.browser.new_page()
+        if self.pool:
+            # Borrow a warm context instead of launching a browser
+            self._context = await self.pool.acquire()
+            self.page = await self._context.new_page()
+        else:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.config.headless
+            )
+            self.page = await self.browser.new_page()
+        self._locator_cache.clear()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._context:
+            await self.pool.release(self._context)
+            self._context = None
+            return
         if self.browser:
             await self.browser.close()
         if self.playwright:
             await self.playwright.stop()
 
     async def extract_data_from_page(self) -> List[Dict[str, Any]]:
+        return await self._extract_on_page(self.page)
+
+    async def _extract_on_page(self, page: Page) -> List[Dict[str, Any]]:
         page_data = []
 
         # Get the items selector (should be a string, not a list)
@@ -53,84 +183,83 @@ class PaginatedCrawler:
             self.logger.warning("No 'items' selector found in config")
             return page_data
 
-        items = await self.page.query_selector_all(item_selector)
+        field_selectors = self.config.field_selectors
 
-        for item in items:
-            item_data = {}
+        if self.config.batch_extraction:
+            try:
+                items_data = await self._get_locator(item_selector, page).evaluate_all(
+                    _EXTRACT_ITEMS_JS, field_selectors
+                )
+                return [item_data for item_data in items_data if item_data]
+            except Exception as e:
+                self.logger.warning(
+                    f"Batched extraction failed, falling back to per-element: {e}"
+                )
 
-            for field_name, field_selector in self.config.selectors.items():
-                if field_name == "items":
-                    continue
+        items = await self._get_locator(item_selector, page).all()
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_items or 16)
 
-                try:
-                    element = await item.query_selector(field_selector)
-                    if element:
-                        item_data[field_name] = await element.text_content()
-                    else:
-                        item_data[field_name] = None
-                except Exception as e:
-                    self.logger.warning(f"Error extracting {field_name}: {e}")
-                    item_data[field_name] = None
+        async def extract_one(item) -> Dict[str, Any]:
+            async with semaphore:
+                values = await asyncio.gather(
+                    *(
+                        self._extract_field(item, field_name, field_selector)
+                        for field_name, field_selector in field_selectors
+                    )
+                )
+            return {
+                field_name: value
+                for (field_name, _), value in zip(field_selectors, values)
+            }
 
+        # Items are gathered concurrently; results keep page order
+        for item_data in await asyncio.gather(*(extract_one(it) for it in items)):
             if item_data:
                 page_data.append(item_data)
 
         return page_data
 
+    def _get_locator(self, selector: str, page: Optional[Page] = None) -> Locator:
+        # Locators are lazy and bound to the page rather than the document,
+        # so they stay valid across navigations and are built once per session
+        if page is not None and page is not self.page:
+            return page.locator(selector)
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
+
+    async def _wait_for_page(self, page: Page):
+        await page.wait_for_load_state("domcontentloaded")
+        try:
+            # Best effort only: pages with long-polling beacons never go idle
+            await page.wait_for_load_state(
+                "networkidle", timeout=self.config.network_idle_timeout_ms
+            )
+        except PlaywrightTimeoutError:
+            self.logger.debug("Network did not go idle, continuing")
+
+    async def _extract_field(self, item, field_name: str, field_selector: str):
+        try:
+            element = item.locator(field_selector).first
+            if await element.count():
+                return await element.text_content()
+            return None
+        except Exception as e:
+            self.logger.warning(f"Error extracting {field_name}: {e}")
+            return None
+
     async def _is_element_clickable(self, element) -> bool:
         """
         Comprehensive check to determine if an element is clickable.
-        Checks for various disabled states and visibility issues.
+        Checks for various disabled states and visibility issues in a single
+        in-page call.
         """
         try:
-            # Check disabled attribute
-            is_disabled = await element.get_attribute("disabled")
-            if is_disabled is not None:
-                self.logger.info(f"Element is disabled (disabled attribute)")
+            reason = await element.evaluate(_UNCLICKABLE_REASON_JS)
+            if reason:
+                self.logger.info(f"Element is not clickable: {reason}")
                 return False
-
-            # Check aria-disabled
-            aria_disabled = await element.get_attribute("aria-disabled")
-            if aria_disabled == "true":
-                self.logger.info(f"Element is disabled (aria-disabled)")
-                return False
-
-            # Check class name for disabled indicators
-            class_name = await element.get_attribute("class") or ""
-            disabled_classes = [
-                "disabled",
-                "btn-disabled",
-                "inactive",
-                "not-clickable",
-                "btn-inactive",
-            ]
-            if any(
-                disabled_class in class_name.lower()
-                for disabled_class in disabled_classes
-            ):
-                self.logger.info(f"Element has disabled class: {class_name}")
-                return False
-
-            # Check if element is visible and has dimensions
-            is_visible = await element.is_visible()
-            if not is_visible:
-                self.logger.info(f"Element is not visible")
-                return False
-
-            # Check computed styles for pointer-events and opacity
-            pointer_events = await element.evaluate(
-                "el => getComputedStyle(el).pointerEvents"
-            )
-            opacity = await element.evaluate("el => getComputedStyle(el).opacity")
-
-            if pointer_events == "none":
-                self.logger.info(f"Element has pointer-events: none")
-                return False
-
-            if float(opacity) < 0.1:
-                self.logger.info(f"Element has very low opacity: {opacity}")
-                return False
-
             return True
 
         except Exception as e:
@@ -142,68 +271,35 @@ class PaginatedCrawler:
             return False
 
         try:
-            # Find all elements matching the pagination selector
-            pagination_elements = await self.page.query_selector_all(
-                self.config.pagination_selector
-            )
-            if not pagination_elements:
-                return False
-
-            selected_element = None
-
-            # Check if config has original content for verification
-            if (
-                hasattr(self.config, "pagination_original_content")
-                and self.config.pagination_original_content
-            ):
-                original_content = (
-                    self.config.pagination_original_content.strip().lower()
-                )
-                self.logger.info(
-                    f"Looking for pagination element containing: '{original_content}'"
+            if self.config.strict_clickability:
+                selected_element = await self.page.query_selector(
+                    self.config.pagination_selector
                 )
-
-                for element in pagination_elements:
-                    element_text = await element.text_content()
-                    if element_text:
-                        element_text = element_text.strip().lower()
-
-                        # Check if element contains the original content
-                        if (
-                            original_content in element_text
-                            or element_text in original_content
-                            or element_text == original_content
-                        ):
-                            selected_element = element
-                            self.logger.info(
-                                f"Found matching pagination element with content: '{element_text}'"
-                            )
-                            break
-
-                # If no content match found, use first element as fallback
-                if not selected_element and pagination_elements:
-                    self.logger.warning(
-                        f"No pagination element found with content matching '{original_content}', using first available"
-                    )
-                    selected_element = pagination_elements[0]
+                # Comprehensive check if element is clickable
+                if not selected_element or not await self._is_element_clickable(
+                    selected_element
+                ):
+                    return False
             else:
-                # No original content specified, use first element
-                selected_element = pagination_elements[0]
-
-            if not selected_element:
-                return False
-
-            # Comprehensive check if element is clickable
-            if not await self._is_element_clickable(selected_element):
-                return False
+                # Only the first candidate counts, as in strict mode; the
+                # clickable selector just rules it out when hidden or disabled.
+                # Skipping to a later candidate could click "prev" once "next"
+                # is disabled on the last page.
+                selected_element = self._get_locator(
+                    self.config.pagination_selector
+                ).first.and_(self._get_locator(self._pagination_selector))
+                if not await selected_element.count():
+                    return False
 
             # Log what we're about to click
             element_text = await selected_element.text_content()
             element_text_clean = element_text.strip() if element_text else ""
+            await asyncio.sleep(max(0.0, self._next_request_at - time.monotonic()))
+
             self.logger.info(f"Clicking pagination element: '{element_text_clean}'")
             await selected_element.click()
-            await self.page.wait_for_load_state("networkidle")
-            await asyncio.sleep(self.config.delay_ms / 1000)
+            await self._wait_for_page(self.page)
+            self._next_request_at = time.monotonic() + self.config.delay_ms / 1000
 
             self.current_page += 1
             return True
@@ -215,10 +311,14 @@ class PaginatedCrawler:
     async def crawl(
         self, custom_extractor: Optional[Callable] = None
     ) -> List[Dict[str, Any]]:
+        """
+        Crawl from base_url, following pagination until max_pages or the last
+        page. Start it with run_crawl() to use uvloop when it is available.
+        """
         self.logger.info(f"Starting crawl of {self.config.base_url}")
 
         await self.page.goto(self.config.base_url)
-        await self.page.wait_for_load_state("networkidle")
+        await self._wait_for_page(self.page)
 
         while True:
             self.logger.info(f"Crawling page {self.current_page}")
@@ -242,27 +342,102 @@ class PaginatedCrawler:
                 break
 
         self.logger.info(f"Crawling completed. Total items: {len(self.data)}")
-        return self.data
+        return self.get_data()
+
+    async def crawl_parallel(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Crawl a known list of page URLs concurrently, one browser context per
+        URL, with at most config.max_parallel contexts open at a time. Page
+        loads still start at least config.delay_ms apart; what overlaps is
+        waiting for pages and extracting them. Results are appended in URL
+        order.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_parallel or 3)
+        self.logger.info(f"Starting parallel crawl of {len(urls)} pages")
+
+        results = await asyncio.gather(
+            *(self._crawl_one(url, semaphore) for url in urls)
+        )
+        for page_data in results:
+            self.data.extend(page_data)
+
+        self.logger.info(f"Crawling completed. Total items: {len(self.data)}")
+        return self.get_data()
+
+    async def _crawl_one(
+        self, url: str, semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        async with semaphore:
+            if self.pool:
+                # The crawler already holds one pooled context, so borrowing
+                # more could starve the pool; open extra ones on its browser
+                context = await self.pool.browser.new_context(
+                    **self.pool.context_options
+                )
+            else:
+                context = await self.browser.new_context()
+            try:
+                page = await context.new_page()
+                await self._wait_for_request_slot()
+                await page.goto(url)
+                await self._wait_for_page(page)
+                page_data = await self._extract_on_page(page)
+                self.logger.info(f"Extracted {len(page_data)} items from {url}")
+                return page_data
+            finally:
+                await context.close()
+
+    async def _wait_for_request_slot(self):
+        """Sleep until the next politeness slot, reserving it for this request"""
+        now = time.monotonic()
+        start = max(now, self._next_request_at)
+        # Reserved before sleeping, so concurrent callers queue up behind it
+        self._next_request_at = start + self.config.delay_ms / 1000
+        await asyncio.sleep(start - now)
 
     def save_data(self, filename: Optional[str] = None):
         if not self.data:
             self.logger.warning("No data to save")
             return
 
+        self._write_data(self.data, filename)
+
+    async def save_data_async(self, filename: Optional[str] = None):
+        """
+        Like save_data, but serializes and writes in a worker thread so the
+        event loop keeps serving other crawls during large writes
+        """
+        if not self.data:
+            self.logger.warning("No data to save")
+            return
+
+        # Snapshot on the loop so the thread never sees data being appended
+        await asyncio.to_thread(self._write_data, list(self.data), filename)
+
+    def _write_data(self, data, filename: Optional[str] = None):
         filename = filename or f"{self.config.output_file}.{self.config.output_format}"
 
         if self.config.output_format.lower() == "json":
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            with open(filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        data,
+                        default=_json_default,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
         elif self.config.output_format.lower() == "csv":
-            if self.data:
-                fieldnames = list(self.data[0].keys())
-                with open(filename, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.data)
+            # Columns in first-seen order across all rows, so no field is lost
+            fieldnames = list(dict.fromkeys(k for item in data for k in item))
+            with open(filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                # Stream rows; missing fields are written as empty cells
+                writer.writerows(
+                    [item.get(field) for field in fieldnames] for item in data
+                )
 
         self.logger.info(f"Data saved to {filename}")
 
     def get_data(self) -> List[Dict[str, Any]]:
-        return self.data
+        return list(self.data)
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
-import asyncio
-from app.core.crawler import PaginatedCrawler, CrawlerConfig
+from app.core.crawler import PaginatedCrawler, CrawlerConfig, run_crawl
 from app.core.config import PresetConfigs
 
 
@@ -111,4 +110,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_crawl(main())
@@ -25,7 +25,7 @@ from .selector import (
 from .configurator import WorkflowConfigurator
 from .browser_manager import BrowserManager
 from .ui_injector import UIInjector
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, format_configuration_preview
 from .selector_core import InteractiveSelector as CoreSelector
 from .demo import interactive_selection_demo as demo_main
 
@@ -35,6 +35,7 @@ __all__ = [
     "BrowserManager",
     "UIInjector",
     "ConfigManager",
+    "format_configuration_preview",
     "CoreSelector",
     "interactive_selection_demo",
     "run_interactive_demo_with_url",
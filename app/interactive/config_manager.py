@@ -6,16 +6,42 @@ This module handles saving, loading, and previewing crawler configurations
 created through the interactive element selector.
 """
 
-import json
 import logging
+import orjson
 from typing import Optional, List
-from dataclasses import asdict
 from playwright.async_api import Page
 
 # Import shared models to avoid circular dependencies
 from app.models import ElementSelection, WorkflowStep, CrawlerConfiguration
 
 
+def format_configuration_preview(config: CrawlerConfiguration) -> str:
+    """Build the human-readable preview of a configuration"""
+    lines = [
+        f"\n🔧 Configuration Preview: {config.name}",
+        f"🌐 Base URL: {config.base_url}",
+    ]
+
+    if config.selections:
+        lines.append(f"\n📊 Data Fields ({len(config.selections)} total):")
+        for selection in config.selections:
+            lines.append(
+                f"  • {selection.name} ({selection.element_type}): {selection.selector}"
+            )
+
+    if config.pagination_config:
+        lines.append(f"\n📄 Pagination: {config.pagination_config.selector}")
+
+    if config.workflows:
+        lines.append(f"\n🔄 Workflows ({len(config.workflows)} steps):")
+        for i, step in enumerate(config.workflows, 1):
+            lines.append(f"  {i}. {step.description} -> {step.target_selector}")
+            if step.extract_fields:
+                lines.append(f"     Extract: {', '.join(step.extract_fields)}")
+
+    return "\n".join(lines)
+
+
 class ConfigManager:
     """Manages crawler configuration operations"""
     
@@ -148,18 +174,17 @@ class ConfigManager:
     
     async def save_configuration(self, config: CrawlerConfiguration, filename: str):
         """Save configuration to JSON file"""
-        config_dict = asdict(config)
-
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        # orjson encodes the dataclasses directly, without an asdict() copy
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
         self.logger.info(f"Configuration saved to {filename}")
     
     async def load_configuration(self, filename: str) -> Optional[CrawlerConfiguration]:
         """Load configuration from JSON file"""
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                config_dict = json.load(f)
+            with open(filename, "rb") as f:
+                config_dict = orjson.loads(f.read())
             
             # Convert dictionaries back to dataclasses
             selections = [ElementSelection(**sel) for sel in config_dict.get("selections", [])]
@@ -183,25 +208,7 @@ class ConfigManager:
     
     def preview_configuration(self, config: CrawlerConfiguration):
         """Print a human-readable preview of the configuration"""
-        print(f"\n🔧 Configuration Preview: {config.name}")
-        print(f"🌐 Base URL: {config.base_url}")
-
-        if config.selections:
-            print(f"\n📊 Data Fields ({len(config.selections)} total):")
-            for selection in config.selections:
-                print(
-                    f"  • {selection.name} ({selection.element_type}): {selection.selector}"
-                )
-
-        if config.pagination_config:
-            print(f"\n📄 Pagination: {config.pagination_config.selector}")
-
-        if config.workflows:
-            print(f"\n🔄 Workflows ({len(config.workflows)} steps):")
-            for i, step in enumerate(config.workflows, 1):
-                print(f"  {i}. {step.description} -> {step.target_selector}")
-                if step.extract_fields:
-                    print(f"     Extract: {', '.join(step.extract_fields)}")
+        print(format_configuration_preview(config))
     
     def get_configuration_summary(self, config: CrawlerConfiguration) -> dict:
         """Get a summary of the configuration for programmatic use"""
@@ -11,7 +11,9 @@ This module provides a complete interface for users to:
 
 import asyncio
 import json
+import orjson
 import os
+from dataclasses import replace
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from app.interactive.selector import InteractiveSelector
@@ -21,10 +23,14 @@ from app.advanced.workflow_builder import WorkflowBuilder
 
 
 class WorkflowConfigurator:
-    def __init__(self):
+    def __init__(self, config_directory: Optional[str] = None):
         self.configurations: Dict[str, CrawlerConfiguration] = {}
-        self.config_directory = "crawler_configs"
-        self._ensure_config_directory()
+        if config_directory is None:
+            self.config_directory = "crawler_configs"
+            self._ensure_config_directory()
+        else:
+            # A caller-supplied directory is expected to exist already
+            self.config_directory = config_directory
 
     def _ensure_config_directory(self):
         """Create configurations directory if it doesn't exist"""
@@ -53,7 +59,7 @@ class WorkflowConfigurator:
 
             config = await selector.get_configuration()
             if config:
-                config.name = config_name
+                config = replace(config, name=config_name)
 
                 # Save configuration
                 config_file = os.path.join(self.config_directory, f"{config_name}.json")
@@ -139,8 +145,7 @@ class WorkflowConfigurator:
                 print(f"❌ Configuration '{config_name}' not found in memory or files")
                 return False
 
-        config = self.configurations[config_name]
-        config.max_pages = max_pages
+        config = replace(self.configurations[config_name], max_pages=max_pages)
 
         print(f"\n🧪 Testing configuration: {config_name}")
 
@@ -207,8 +212,8 @@ class WorkflowConfigurator:
 
             full_path = os.path.join(self.config_directory, config_file)
 
-            with open(full_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            with open(full_path, "rb") as f:
+                config_data = orjson.loads(f.read())
 
             selections = [ElementSelection(**sel) for sel in config_data["selections"]]
             workflows = [WorkflowStep(**wf) for wf in config_data["workflows"]]
@@ -16,7 +16,7 @@ from app.models import ElementSelection, WorkflowStep, CrawlerConfiguration
 # Import the modular components
 from .browser_manager import BrowserManager
 from .ui_injector import UIInjector
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, format_configuration_preview
 
 
 class InteractiveSelector:
@@ -110,7 +110,8 @@ class InteractiveSelector:
 
     def preview_configuration(self, config: CrawlerConfiguration):
         """Print a human-readable preview of the configuration"""
-        self.config_manager.preview_configuration(config)
+        # Formatting needs no page, so this works before the browser starts
+        print(format_configuration_preview(config))
 
     def get_configuration_summary(self, config: CrawlerConfiguration) -> dict:
         """Get a summary of the configuration for programmatic use"""
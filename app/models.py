@@ -6,11 +6,12 @@ This module contains the core data structures used across the crawler system
 to avoid circular import dependencies.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ElementSelection:
     name: str
     selector: str
@@ -27,8 +28,17 @@ class ElementSelection:
     )
     page_url: Optional[str] = None  # Track which page this selection was made on
 
+    def __post_init__(self):
+        # Names and selectors are hashed and compared on every extracted item,
+        # so intern them once; equal strings then compare by identity. Loaded
+        # configs may carry nulls, which are left as they are
+        for attr in ("name", "selector"):
+            value = getattr(self, attr)
+            if isinstance(value, str):
+                object.__setattr__(self, attr, sys.intern(value))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class WorkflowStep:
     step_id: str
     action: str  # 'click', 'extract', 'navigate_back', 'open_new_tab'
@@ -39,7 +49,7 @@ class WorkflowStep:
     wait_selector: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CrawlerConfiguration:
     name: str
     base_url: str
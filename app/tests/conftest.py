@@ -4,16 +4,27 @@ Shared test fixtures and configuration for the crawler test suite
 """
 
 import pytest
-import asyncio
+import pytest_asyncio
 import tempfile
 import shutil
 from unittest.mock import AsyncMock, Mock
 
+from app.advanced.advanced_crawler import FIREFOX_CONTEXT_OPTIONS, FIREFOX_USER_PREFS
+from app.core.browser_pool import BrowserPool
 from app.core.config import SiteConfig
 from app.core.crawler import CrawlerConfig
 from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
 
 
+def pytest_report_header(config):
+    # The fail_slow marker is registered in pyproject, so a missing plugin
+    # would otherwise go unnoticed
+    plugins = config.pluginmanager.get_plugins()
+    if any(getattr(p, "__name__", None) == "pytest_fail_slow" for p in plugins):
+        return "fail_slow budgets: enforced"
+    return "fail_slow budgets: NOT enforced (pytest-fail-slow is not installed)"
+
+
 @pytest.fixture
 def basic_site_config():
     """Basic SiteConfig fixture for testing"""
@@ -164,6 +175,27 @@ def mock_playwright():
     }
 
 
+@pytest_asyncio.fixture(scope="session")
+async def browser_pool():
+    """
+    One headless Firefox shared by the real-browser tests. Every acquire()
+    gets an unused context, closed on release(), so tests stay isolated.
+    """
+    pool = BrowserPool(
+        size=1,
+        max_uses=1,
+        browser_type="firefox",
+        launch_options={"firefox_user_prefs": FIREFOX_USER_PREFS},
+        context_options=FIREFOX_CONTEXT_OPTIONS,
+    )
+    async with pool:
+        yield pool
+
+    # No test may have seen another test's context, and none may leak
+    assert pool.stats["reused"] == 0
+    assert pool.stats["created"] == pool.stats["destroyed"]
+
+
 @pytest.fixture
 def mock_element():
     """Mock browser element for testing"""
@@ -185,14 +217,6 @@ def temp_config_dir():
     shutil.rmtree(temp_dir)
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 # Async test utilities
 @pytest.fixture
 def async_mock_context():
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Lightweight Playwright stand-ins for unit tests
+
+Plain async methods over pre-populated data, for tests that only need canned
+page content. Use AsyncMock where a test asserts on calls.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class FakeElement:
+    """An element with its own text and the texts of its child fields"""
+
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        fields: Optional[Dict[str, str]] = None,
+        unclickable_reason: Optional[str] = None,
+    ):
+        self.text = text
+        self.fields = fields or {}
+        self.unclickable_reason = unclickable_reason
+        self.clicks = 0
+
+    def locator(self, selector: str) -> "FakeLocator":
+        if selector in self.fields:
+            return FakeLocator([FakeElement(self.fields[selector])])
+        return FakeLocator([])
+
+    async def text_content(self) -> Optional[str]:
+        return self.text
+
+    async def evaluate(self, script: str, arg: Any = None) -> Optional[str]:
+        # The crawler's only element script is the clickability check
+        return self.unclickable_reason
+
+    async def click(self):
+        self.clicks += 1
+
+
+class FakeLocator:
+    """A resolved list of elements behind a selector"""
+
+    def __init__(
+        self,
+        elements: List[FakeElement],
+        evaluate_error: Optional[Exception] = None,
+    ):
+        self.elements = elements
+        self.evaluate_error = evaluate_error
+
+    @property
+    def first(self) -> "FakeLocator":
+        return FakeLocator(self.elements[:1])
+
+    def and_(self, other: "FakeLocator") -> "FakeLocator":
+        return FakeLocator([el for el in self.elements if el in other.elements])
+
+    async def all(self) -> List[FakeElement]:
+        return list(self.elements)
+
+    async def count(self) -> int:
+        return len(self.elements)
+
+    async def text_content(self) -> Optional[str]:
+        return await self.elements[0].text_content()
+
+    async def click(self):
+        await self.elements[0].click()
+
+    async def evaluate_all(self, script: str, fields: Any) -> List[Dict]:
+        # Mirrors the batched extraction script: one dict per matching item
+        if self.evaluate_error:
+            raise self.evaluate_error
+        return [
+            {name: item.fields.get(selector) for name, selector in fields}
+            for item in self.elements
+        ]
+
+
+class FakePage:
+    """A page whose selectors resolve to fixed lists of FakeElements"""
+
+    def __init__(
+        self,
+        elements: Optional[Dict[str, List[FakeElement]]] = None,
+        evaluate_error: Optional[Exception] = None,
+    ):
+        self.elements = elements or {}
+        self.evaluate_error = evaluate_error
+        self.locator_calls: List[str] = []
+        self.load_states: List[str] = []
+
+    def locator(self, selector: str) -> FakeLocator:
+        self.locator_calls.append(selector)
+        return FakeLocator(self.elements.get(selector, []), self.evaluate_error)
+
+    async def query_selector(self, selector: str) -> Optional[FakeElement]:
+        return next(iter(self.elements.get(selector, [])), None)
+
+    async def wait_for_load_state(
+        self, state: str = "load", timeout: Optional[float] = None
+    ):
+        self.load_states.append(state)
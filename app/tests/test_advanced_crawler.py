@@ -5,10 +5,13 @@ Unit tests for advanced_crawler.py
 Tests the advanced crawler with workflow support.
 """
 
+import io
+import json
+import re
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
-from datetime import datetime
+from urllib.parse import urlsplit
 
 from app.advanced.advanced_crawler import (
     AdvancedCrawler,
@@ -19,6 +22,19 @@ from app.advanced.advanced_crawler import (
 from app.advanced.workflow_builder import WorkflowBuilder
 from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
 
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+_SAMPLE_RESULTS = (
+    ExtractionResult({}, "https://test.com/page1", "2024-01-01", ()),
+    ExtractionResult({}, "https://test.com/page2", "2024-01-01", ("workflow1",)),
+    ExtractionResult({}, "https://test.com/page1", "2024-01-01", ()),
+)
+
+_SAMPLE_HISTORY = (
+    NavigationState("https://test.com/page1", 1, 0, {}),
+    NavigationState("https://test.com/page2", 2, 0, {}),
+)
+
 
 class TestExtractionResult:
     """Test ExtractionResult dataclass"""
@@ -167,36 +183,41 @@ class TestWorkflowBuilder:
 
 
 @pytest.mark.asyncio
+@pytest.mark.fail_slow("100ms")
 class TestAdvancedCrawler:
     """Test AdvancedCrawler functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.selections = [
-            ElementSelection("items", ".product", "items_container", "Product items"),
-            ElementSelection("title", ".title", "data_field", "Product title"),
-            ElementSelection("price", ".price", "data_field", "Product price"),
-        ]
-
-        self.pagination_config = ElementSelection(
-            "next", ".pagination .next", "pagination", "Next page"
-        )
-
-        self.config = CrawlerConfiguration(
+    @pytest.fixture(scope="class")
+    def config(self):
+        """Shared configuration for the crawler tests"""
+        return CrawlerConfiguration(
             name="Test Config",
             base_url="https://test.com",
-            selections=self.selections,
+            selections=[
+                ElementSelection(
+                    "items", ".product", "items_container", "Product items"
+                ),
+                ElementSelection("title", ".title", "data_field", "Product title"),
+                ElementSelection("price", ".price", "data_field", "Product price"),
+            ],
             workflows=[],
-            pagination_config=self.pagination_config,
+            pagination_config=ElementSelection(
+                "next", ".pagination .next", "pagination", "Next page"
+            ),
             max_pages=2,
             delay_ms=100,
         )
 
-    def test_advanced_crawler_initialization(self):
+    @pytest.fixture(scope="class")
+    def crawler(self, config):
+        """Shared read-only crawler for helper method tests"""
+        return AdvancedCrawler(config)
+
+    def test_advanced_crawler_initialization(self, config):
         """Test AdvancedCrawler initialization"""
-        crawler = AdvancedCrawler(self.config, headless=True)
+        crawler = AdvancedCrawler(config, headless=True)
 
-        assert crawler.config == self.config
+        assert crawler.config == config
         assert crawler.headless is True
         assert crawler.browser is None
         assert crawler.context is None
@@ -205,10 +226,8 @@ class TestAdvancedCrawler:
         assert crawler.navigation_history == []
         assert crawler.visited_urls == set()
 
-    def test_get_items_selector(self):
+    def test_get_items_selector(self, crawler):
         """Test _get_items_selector method"""
-        crawler = AdvancedCrawler(self.config)
-
         items_selector = crawler._get_items_selector()
 
         assert items_selector is not None
@@ -232,10 +251,8 @@ class TestAdvancedCrawler:
 
         assert items_selector is None
 
-    def test_find_selection_by_name(self):
+    def test_find_selection_by_name(self, crawler):
         """Test _find_selection_by_name method"""
-        crawler = AdvancedCrawler(self.config)
-
         # Find existing selection
         title_selection = crawler._find_selection_by_name("title")
         assert title_selection is not None
@@ -246,10 +263,19 @@ class TestAdvancedCrawler:
         missing_selection = crawler._find_selection_by_name("nonexistent")
         assert missing_selection is None
 
-    async def test_extract_element_value_text(self):
-        """Test _extract_element_value with text extraction"""
-        crawler = AdvancedCrawler(self.config)
+    def test_selections_grouped_by_type(self, crawler):
+        """Test that selections are indexed by element type in config order"""
+        data_fields = [
+            s for s in crawler.config.selections if s.element_type == "data_field"
+        ]
 
+        assert crawler._selections_by_type["data_field"] == data_fields
+        assert crawler._selections_by_type["items_container"] == [
+            crawler._get_items_selector()
+        ]
+
+    async def test_extract_element_value_text(self, crawler):
+        """Test _extract_element_value with text extraction"""
         mock_element = AsyncMock()
         mock_element.text_content = AsyncMock(return_value="Test Text")
 
@@ -258,10 +284,8 @@ class TestAdvancedCrawler:
         result = await crawler._extract_element_value(mock_element, selection)
         assert result == "Test Text"
 
-    async def test_extract_element_value_href(self):
+    async def test_extract_element_value_href(self, crawler):
         """Test _extract_element_value with href extraction"""
-        crawler = AdvancedCrawler(self.config)
-
         mock_element = AsyncMock()
         mock_element.get_attribute = AsyncMock(return_value="https://test.com/link")
 
@@ -270,10 +294,8 @@ class TestAdvancedCrawler:
         result = await crawler._extract_element_value(mock_element, selection)
         assert result == "https://test.com/link"
 
-    async def test_extract_element_value_attribute(self):
+    async def test_extract_element_value_attribute(self, crawler):
         """Test _extract_element_value with custom attribute"""
-        crawler = AdvancedCrawler(self.config)
-
         mock_element = AsyncMock()
         mock_element.get_attribute = AsyncMock(return_value="custom_value")
 
@@ -290,73 +312,85 @@ class TestAdvancedCrawler:
         assert result == "custom_value"
         mock_element.get_attribute.assert_called_with("data-custom")
 
-    def test_get_timestamp(self):
-        """Test _get_timestamp method"""
-        crawler = AdvancedCrawler(self.config)
-
-        timestamp = crawler._get_timestamp()
-
-        # Should be valid ISO format timestamp
-        assert isinstance(timestamp, str)
-        # Should be parseable as datetime
-        parsed = datetime.fromisoformat(timestamp)
-        assert isinstance(parsed, datetime)
-
-    def test_is_field_for_current_page_same_domain_path(self):
-        """Test _is_field_for_current_page with same domain and path"""
-        crawler = AdvancedCrawler(self.config)
-
-        field_url = "https://example.com/products"
-        current_url = "https://example.com/products"
-
-        result = crawler._is_field_for_current_page(field_url, current_url)
-        assert result is True
-
-    def test_is_field_for_current_page_different_domain(self):
-        """Test _is_field_for_current_page with different domains"""
-        crawler = AdvancedCrawler(self.config)
-
-        field_url = "https://other.com/products"
-        current_url = "https://example.com/products"
-
-        result = crawler._is_field_for_current_page(field_url, current_url)
-        assert result is False
+    @pytest.mark.parametrize(
+        "attributes",
+        [
+            {"disabled": ""},
+            {"aria-disabled": "true"},
+            {"class": "page-link BTN-Inactive"},
+        ],
+    )
+    async def test_is_element_clickable_disabled(self, crawler, attributes):
+        """Test that disabled markers short-circuit before visibility checks"""
+        mock_element = AsyncMock()
+        mock_element.get_attribute = AsyncMock(side_effect=attributes.get)
 
-    def test_is_field_for_current_page_more_specific_path(self):
-        """Test _is_field_for_current_page with more specific field path"""
-        crawler = AdvancedCrawler(self.config)
+        assert await crawler._is_element_clickable(mock_element) is False
+        assert mock_element.get_attribute.call_count == 3
+        mock_element.is_visible.assert_not_called()
 
-        field_url = "https://example.com/products/detail/123"  # More specific
-        current_url = "https://example.com/products"  # Broader
+    async def test_is_element_clickable_success(self, crawler):
+        """Test element clickability check with clickable element"""
+        styles = {
+            "el => getComputedStyle(el).pointerEvents": "auto",
+            "el => getComputedStyle(el).opacity": "1",
+        }
+        mock_element = AsyncMock()
+        mock_element.get_attribute = AsyncMock(return_value=None)
+        mock_element.is_visible = AsyncMock(return_value=True)
+        mock_element.evaluate = AsyncMock(side_effect=styles.get)
 
-        result = crawler._is_field_for_current_page(field_url, current_url)
-        assert result is False  # Field is for detail page, we're on listing
+        assert await crawler._is_element_clickable(mock_element) is True
 
-    def test_is_field_for_current_page_broader_field_path(self):
-        """Test _is_field_for_current_page with broader field path"""
-        crawler = AdvancedCrawler(self.config)
+    def test_get_timestamp(self, crawler):
+        """Test _get_timestamp method"""
+        timestamp = crawler._get_timestamp()
 
-        field_url = "https://example.com/products"  # Broader
-        current_url = "https://example.com/products/detail"  # More specific
+        # Should be valid ISO format timestamp
+        assert isinstance(timestamp, str)
+        assert _ISO_RE.match(timestamp)
+
+    @pytest.mark.parametrize(
+        "field_url,current_url,expected",
+        [
+            # Same domain and path
+            ("https://example.com/products", "https://example.com/products", True),
+            # Different domains
+            ("https://other.com/products", "https://example.com/products", False),
+            # Field is for a more specific (detail) page than the listing
+            (
+                "https://example.com/products/detail/123",
+                "https://example.com/products",
+                False,
+            ),
+            # Field applies to a broader scope
+            (
+                "https://example.com/products",
+                "https://example.com/products/detail",
+                True,
+            ),
+        ],
+    )
+    def test_is_field_for_current_page(self, crawler, field_url, current_url, expected):
+        """Test _is_field_for_current_page with pre-split URLs"""
+        result = crawler._is_field_for_current_page(
+            urlsplit(field_url), urlsplit(current_url)
+        )
+        assert result is expected
 
-        result = crawler._is_field_for_current_page(field_url, current_url)
-        assert result is True  # Field applies to broader scope
+    def test_is_field_for_current_page_accepts_strings(self, crawler):
+        """Test _is_field_for_current_page parses raw URL strings"""
+        assert crawler._is_field_for_current_page(
+            "https://example.com/products", "https://example.com/products/detail"
+        )
 
-    def test_get_extraction_summary(self):
+    def test_get_extraction_summary(self, config):
         """Test get_extraction_summary method"""
-        crawler = AdvancedCrawler(self.config)
+        crawler = AdvancedCrawler(config)
 
         # Add test data
-        crawler.data = [
-            ExtractionResult({}, "https://test.com/page1", "2024-01-01", []),
-            ExtractionResult({}, "https://test.com/page2", "2024-01-01", ["workflow1"]),
-            ExtractionResult({}, "https://test.com/page1", "2024-01-01", []),
-        ]
-
-        crawler.navigation_history = [
-            NavigationState("https://test.com/page1", 1, 0, {}),
-            NavigationState("https://test.com/page2", 2, 0, {}),
-        ]
+        crawler.data = list(_SAMPLE_RESULTS)
+        crawler.navigation_history = list(_SAMPLE_HISTORY)
 
         summary = crawler.get_extraction_summary()
 
@@ -369,9 +403,7 @@ class TestAdvancedCrawler:
 class TestLoadInteractiveConfig:
     """Test load_interactive_config function"""
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_interactive_config_success(self, mock_json_load, mock_open):
+    def test_load_interactive_config_success(self):
         """Test successful loading of interactive configuration"""
         config_data = {
             "name": "Test Config",
@@ -406,9 +438,11 @@ class TestLoadInteractiveConfig:
             "delay_ms": 2000,
         }
 
-        mock_json_load.return_value = config_data
-
-        config = load_interactive_config("test_config.json")
+        config = load_interactive_config(
+            "test_config.json",
+            _loader=lambda f: config_data,
+            _opener=lambda *a, **k: io.StringIO("{}"),
+        )
 
         assert isinstance(config, CrawlerConfiguration)
         assert config.name == "Test Config"
@@ -419,9 +453,7 @@ class TestLoadInteractiveConfig:
         assert config.max_pages == 5
         assert config.delay_ms == 2000
 
-    @patch("builtins.open")
-    @patch("json.load")
-    def test_load_interactive_config_no_pagination(self, mock_json_load, mock_open):
+    def test_load_interactive_config_no_pagination(self):
         """Test loading configuration without pagination"""
         config_data = {
             "name": "Test Config",
@@ -433,15 +465,33 @@ class TestLoadInteractiveConfig:
             "delay_ms": 1000,
         }
 
-        mock_json_load.return_value = config_data
-
-        config = load_interactive_config("test_config.json")
+        config = load_interactive_config(
+            "test_config.json",
+            _opener=lambda *a, **k: io.StringIO(json.dumps(config_data)),
+        )
 
         assert config.pagination_config is None
         assert config.max_pages is None
         assert config.delay_ms == 1000
 
 
+def _wire_playwright_mocks(mock_playwright):
+    """Build the playwright -> browser -> context -> page mock chain"""
+    mock_playwright_instance = AsyncMock()
+    mock_browser = AsyncMock()
+    mock_context = AsyncMock()
+    mock_page = AsyncMock()
+
+    mock_playwright.return_value.start = AsyncMock(
+        return_value=mock_playwright_instance
+    )
+    mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
+    mock_browser.new_context = AsyncMock(return_value=mock_context)
+    mock_context.new_page = AsyncMock(return_value=mock_page)
+
+    return mock_playwright_instance, mock_browser, mock_context, mock_page
+
+
 @pytest.mark.asyncio
 class TestAdvancedCrawlerIntegration:
     """Integration tests for AdvancedCrawler with mocked browser"""
@@ -462,20 +512,18 @@ class TestAdvancedCrawlerIntegration:
             max_pages=1,
         )
 
-    @patch("app.advanced.advanced_crawler.async_playwright")
-    async def test_context_manager_setup(self, mock_playwright):
-        """Test async context manager setup and teardown"""
-        mock_playwright_instance = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_page = AsyncMock()
+    @pytest.fixture(scope="class")
+    def mock_playwright_env(self):
+        """Patch async_playwright once for the whole class"""
+        with patch("app.advanced.advanced_crawler.async_playwright") as mock_playwright:
+            yield mock_playwright
 
-        mock_playwright.return_value.start = AsyncMock(
-            return_value=mock_playwright_instance
+    async def test_context_manager_setup(self, mock_playwright_env):
+        """Test async context manager setup and teardown"""
+        mock_playwright_env.reset_mock()
+        mock_playwright_instance, mock_browser, mock_context, mock_page = (
+            _wire_playwright_mocks(mock_playwright_env)
         )
-        mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_context.new_page = AsyncMock(return_value=mock_page)
 
         crawler = AdvancedCrawler(self.config, headless=True)
 
@@ -489,21 +537,50 @@ class TestAdvancedCrawlerIntegration:
         mock_browser.close.assert_called_once()
         mock_playwright_instance.stop.assert_called_once()
 
-    @patch("app.advanced.advanced_crawler.async_playwright")
-    async def test_extract_item_data(self, mock_playwright):
-        """Test _extract_item_data method"""
-        # Set up mocks
-        mock_playwright_instance = AsyncMock()
-        mock_browser = AsyncMock()
+    async def test_context_manager_with_injected_browser(self, mock_playwright_env):
+        """Test that an injected browser is reused and left open"""
+        mock_playwright_env.reset_mock()
+        _, mock_browser, mock_context, mock_page = _wire_playwright_mocks(
+            mock_playwright_env
+        )
+
+        crawler = AdvancedCrawler(self.config, browser=mock_browser)
+
+        async with crawler:
+            assert crawler.browser is mock_browser
+            assert crawler.context == mock_context
+            assert crawler.main_page == mock_page
+
+        # Only the crawler's own context is closed
+        mock_playwright_env.assert_not_called()
+        mock_context.close.assert_called_once()
+        mock_browser.close.assert_not_called()
+
+    async def test_context_manager_with_pool(self, mock_playwright_env):
+        """Test that a pooled context is borrowed and handed back, not closed"""
+        mock_playwright_env.reset_mock()
         mock_context = AsyncMock()
         mock_page = AsyncMock()
-
-        mock_playwright.return_value.start = AsyncMock(
-            return_value=mock_playwright_instance
-        )
-        mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
         mock_context.new_page = AsyncMock(return_value=mock_page)
+        pool = AsyncMock()
+        pool.acquire = AsyncMock(return_value=mock_context)
+
+        crawler = AdvancedCrawler(self.config, pool=pool)
+
+        async with crawler:
+            assert crawler.context is mock_context
+            assert crawler.main_page is mock_page
+
+        mock_playwright_env.assert_not_called()
+        pool.release.assert_awaited_once_with(mock_context)
+        mock_context.close.assert_not_called()
+        assert crawler.context is None
+
+    async def test_extract_item_data(self, mock_playwright_env):
+        """Test _extract_item_data method"""
+        # Set up mocks
+        mock_playwright_env.reset_mock()
+        _, _, _, mock_page = _wire_playwright_mocks(mock_playwright_env)
 
         # Mock page URL
         mock_page.url = "https://test.com"
@@ -517,12 +594,8 @@ class TestAdvancedCrawlerIntegration:
         mock_price_element = AsyncMock()
         mock_price_element.text_content = AsyncMock(return_value="$10.99")
 
-        mock_item.query_selector = AsyncMock(
-            side_effect=lambda sel: {
-                ".title": mock_title_element,
-                ".price": mock_price_element,
-            }.get(sel)
-        )
+        selectors = {".title": mock_title_element, ".price": mock_price_element}
+        mock_item.query_selector = AsyncMock(side_effect=selectors.get)
 
         async with crawler:
             result = await crawler._extract_item_data(mock_item)
@@ -541,9 +614,7 @@ class TestAdvancedCrawlerIntegration:
         # Should not raise an exception
         crawler.save_results()
 
-    @patch("builtins.open")
-    @patch("json.dump")
-    def test_save_results_json_format(self, mock_json_dump, mock_open_func):
+    def test_save_results_json_format(self):
         """Test saving results in JSON format"""
         crawler = AdvancedCrawler(self.config)
         crawler.data = [
@@ -555,15 +626,25 @@ class TestAdvancedCrawlerIntegration:
             )
         ]
 
-        crawler.save_results("test_output.json", "json")
+        opened = []
 
-        mock_open_func.assert_called_once_with(
-            "test_output.json", "w", encoding="utf-8"
-        )
+        class _Buffer(io.BytesIO):
+            def close(self):
+                # Keep the buffer readable after the ``with`` block exits
+                pass
+
+        buffer = _Buffer()
+
+        def opener(*args, **kwargs):
+            opened.append((args, kwargs))
+            return buffer
 
-        # Check that json.dump was called with serializable data
-        call_args = mock_json_dump.call_args
-        serialized_data = call_args[0][0]
+        crawler.save_results("test_output.json", "json", _opener=opener)
+
+        assert opened == [(("test_output.json", "wb"), {})]
+
+        # Check that serializable data was written
+        serialized_data = json.loads(buffer.getvalue())
 
         assert len(serialized_data) == 1
         assert serialized_data[0]["data"] == {"title": "Test"}
@@ -575,21 +656,22 @@ class TestAdvancedCrawlerIntegration:
 class TestAdvancedCrawlerHelperMethods:
     """Test AdvancedCrawler helper methods without browser setup"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.config = CrawlerConfiguration(
+    @pytest.fixture(scope="class")
+    def crawler(self):
+        """Shared crawler for read-only helper checks"""
+        config = CrawlerConfiguration(
             name="Test", base_url="https://test.com", selections=[], workflows=[]
         )
-        self.crawler = AdvancedCrawler(self.config)
+        return AdvancedCrawler(config)
 
-    def test_get_base_url(self):
-        """Test _get_base_url method"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "full_url,expected_base",
+        [
             ("https://example.com/path/page", "https://example.com"),
             ("http://test.org/deep/nested/path", "http://test.org"),
             ("https://subdomain.example.com/page", "https://subdomain.example.com"),
-        ]
-
-        for full_url, expected_base in test_cases:
-            result = self.crawler._get_base_url(full_url)
-            assert result == expected_base
+        ],
+    )
+    def test_get_base_url(self, crawler, full_url, expected_base):
+        """Test _get_base_url method"""
+        assert crawler._get_base_url(full_url) == expected_base
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for browser_pool.py
+
+Tests reuse and recycling of pooled browser contexts.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core.browser_pool import BrowserPool
+from app.core.crawler import CrawlerConfig, PaginatedCrawler
+
+
+def _wire_playwright_mocks(mock_playwright):
+    """Return a browser mock whose new_context hands out fresh contexts"""
+    mock_playwright_instance = AsyncMock()
+    mock_browser = AsyncMock()
+    mock_playwright.return_value.start = AsyncMock(
+        return_value=mock_playwright_instance
+    )
+    mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
+    mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
+    mock_browser.new_context = AsyncMock(
+        side_effect=lambda **options: AsyncMock(pages=[])
+    )
+    return mock_playwright_instance, mock_browser
+
+
+@pytest.mark.asyncio
+class TestBrowserPool:
+    """Test BrowserPool functionality"""
+
+    @patch("app.core.browser_pool.async_playwright")
+    async def test_browser_pool_reuse(self, mock_playwright):
+        """Test that crawlers sharing a pool launch the browser only once"""
+        mock_playwright_instance, mock_browser = _wire_playwright_mocks(mock_playwright)
+        config = CrawlerConfig(base_url="https://test.com", selectors={})
+
+        async with BrowserPool(size=1) as pool:
+            async with PaginatedCrawler(config, pool=pool) as first:
+                first_context = first._context
+            async with PaginatedCrawler(config, pool=pool) as second:
+                second_context = second._context
+
+        mock_playwright_instance.chromium.launch.assert_called_once()
+        assert first_context is second_context
+        assert mock_browser.new_context.call_count == 1
+        mock_browser.close.assert_called_once()
+
+    @patch("app.core.browser_pool.async_playwright")
+    async def test_crawl_parallel_does_not_starve_pool(self, mock_playwright):
+        """Test that crawl_parallel never waits on the context the crawler holds"""
+        _, mock_browser = _wire_playwright_mocks(mock_playwright)
+        config = CrawlerConfig(
+            base_url="https://test.com", selectors={}, delay_ms=0, max_parallel=2
+        )
+        urls = [f"https://test.com/?page={n}" for n in range(1, 4)]
+
+        async with BrowserPool(size=1) as pool:
+            async with PaginatedCrawler(config, pool=pool) as crawler:
+                await asyncio.wait_for(crawler.crawl_parallel(urls), timeout=1)
+
+        # One pooled context for the crawler, one throwaway context per URL
+        assert mock_browser.new_context.call_count == 1 + len(urls)
+
+    @patch("app.core.browser_pool.async_playwright")
+    async def test_context_recycled_after_max_uses(self, mock_playwright):
+        """Test that a context is replaced once it reaches max_uses"""
+        _, mock_browser = _wire_playwright_mocks(mock_playwright)
+
+        pool = BrowserPool(size=1, max_uses=2)
+        first = await pool.acquire()
+        await pool.release(first)
+        again = await pool.acquire()
+        await pool.release(again)
+        fresh = await pool.acquire()
+
+        assert again is first
+        assert fresh is not first
+        first.close.assert_called_once()
+        assert mock_browser.new_context.call_count == 2
+
+        await pool.release(fresh)
+        await pool.close()
+
+    @patch("app.core.browser_pool.async_playwright")
+    async def test_single_use_contexts_are_isolated(self, mock_playwright):
+        """Test that max_uses=1 closes each context and never lends it again"""
+        mock_playwright_instance, mock_browser = _wire_playwright_mocks(mock_playwright)
+
+        async with BrowserPool(size=1, max_uses=1) as pool:
+            first = await pool.acquire()
+            await pool.release(first)
+            second = await pool.acquire()
+            await pool.release(second)
+
+        assert second is not first
+        first.close.assert_called_once()
+        mock_playwright_instance.chromium.launch.assert_called_once()
+        assert pool.stats == {"created": 3, "reused": 0, "destroyed": 3}
+
+    @patch("app.core.browser_pool.async_playwright")
+    async def test_browser_type_options_and_stats(self, mock_playwright):
+        """Test launch/context options and the reuse counters"""
+        mock_playwright_instance, mock_browser = _wire_playwright_mocks(mock_playwright)
+        prefs = {"dom.webdriver.enabled": False}
+        viewport = {"width": 1280, "height": 800}
+
+        async with BrowserPool(
+            size=1,
+            max_uses=2,
+            browser_type="firefox",
+            launch_options={"firefox_user_prefs": prefs},
+            context_options={"viewport": viewport},
+        ) as pool:
+            for _ in range(3):
+                await pool.release(await pool.acquire())
+
+        mock_playwright_instance.firefox.launch.assert_called_once_with(
+            headless=True, firefox_user_prefs=prefs
+        )
+        mock_playwright_instance.chromium.launch.assert_not_called()
+        mock_browser.new_context.assert_called_with(viewport=viewport)
+        assert pool.stats == {"created": 2, "reused": 1, "destroyed": 2}
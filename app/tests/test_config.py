@@ -6,6 +6,9 @@ Tests configuration classes and preset configurations.
 """
 
 import pytest
+import subprocess
+import sys
+from collections.abc import Mapping
 from app.core.config import SiteConfig, PresetConfigs
 
 
@@ -50,6 +53,30 @@ class TestSiteConfig:
             SiteConfig()  # Missing required fields
 
 
+def test_fail_slow_budget_trips(tmp_path):
+    """Test that the fail_slow marker used below actually fails slow tests"""
+    pytest.importorskip("pytest_fail_slow")
+    test_file = tmp_path / "test_slow.py"
+    test_file.write_text(
+        "import time\n"
+        "import pytest\n\n"
+        "@pytest.mark.fail_slow('10ms')\n"
+        "def test_sleeps():\n"
+        "    time.sleep(0.1)\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", str(test_file)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 1, result.stdout
+    assert "1 failed" in result.stdout
+
+
+@pytest.mark.fail_slow("100ms")
 class TestPresetConfigs:
     """Test preset configuration methods"""
 
@@ -64,15 +91,12 @@ class TestPresetConfigs:
         assert config.pagination_selector == 'a[rel="next"]'
 
         # Check required selectors
-        assert "items" in config.selectors
-        assert "title" in config.selectors
-        assert "company" in config.selectors
-        assert "link" in config.selectors
-
-        assert config.selectors["items"] == ".athing"
-        assert config.selectors["title"] == ".storylink"
-        assert config.selectors["company"] == ".hnuser"
-        assert config.selectors["link"] == ".storylink"
+        assert config.selectors == {
+            "items": ".athing",
+            "title": ".storylink",
+            "company": ".hnuser",
+            "link": ".storylink",
+        }
 
     def test_quotes_to_scrape_config(self):
         """Test Quotes to Scrape preset configuration"""
@@ -85,15 +109,12 @@ class TestPresetConfigs:
         assert config.pagination_selector == "li.next a"
 
         # Check required selectors
-        assert "items" in config.selectors
-        assert "text" in config.selectors
-        assert "author" in config.selectors
-        assert "tags" in config.selectors
-
-        assert config.selectors["items"] == ".quote"
-        assert config.selectors["text"] == ".text"
-        assert config.selectors["author"] == ".author"
-        assert config.selectors["tags"] == ".tags a"
+        assert config.selectors == {
+            "items": ".quote",
+            "text": ".text",
+            "author": ".author",
+            "tags": ".tags a",
+        }
 
     def test_reddit_subreddit_config(self):
         """Test Reddit subreddit preset configuration"""
@@ -107,7 +128,7 @@ class TestPresetConfigs:
         assert config.pagination_selector == ".next-button a"
 
         # Check required selectors
-        expected_selectors = {
+        assert config.selectors == {
             "items": ".thing",
             "title": ".title a.title",
             "author": ".author",
@@ -115,18 +136,12 @@ class TestPresetConfigs:
             "comments": ".comments",
         }
 
-        for key, value in expected_selectors.items():
-            assert key in config.selectors
-            assert config.selectors[key] == value
-
-    def test_reddit_subreddit_custom_name(self):
+    @pytest.mark.parametrize("subreddit", ["programming", "MachineLearning", "webdev"])
+    def test_reddit_subreddit_custom_name(self, subreddit):
         """Test Reddit configuration with different subreddit names"""
-        test_subreddits = ["programming", "MachineLearning", "webdev"]
-
-        for subreddit in test_subreddits:
-            config = PresetConfigs.reddit_subreddit(subreddit)
-            assert config.name == f"Reddit - {subreddit}"
-            assert config.base_url == f"https://old.reddit.com/r/{subreddit}/"
+        config = PresetConfigs.reddit_subreddit(subreddit)
+        assert config.name == f"Reddit - {subreddit}"
+        assert config.base_url == f"https://old.reddit.com/r/{subreddit}/"
 
     def test_all_presets_return_site_config(self):
         """Test that all preset methods return SiteConfig instances"""
@@ -141,4 +156,16 @@ class TestPresetConfigs:
             assert hasattr(config, "name")
             assert hasattr(config, "base_url")
             assert hasattr(config, "selectors")
-            assert isinstance(config.selectors, dict)
+            assert isinstance(config.selectors, Mapping)
+
+    def test_presets_are_cached_and_read_only(self):
+        """Test that presets are built once and cannot be mutated"""
+        quotes = PresetConfigs.quotes_to_scrape()
+        python = PresetConfigs.reddit_subreddit("python")
+
+        assert PresetConfigs.quotes_to_scrape() is quotes
+        assert PresetConfigs.reddit_subreddit("python") is python
+        assert PresetConfigs.reddit_subreddit("rust") is not python
+
+        with pytest.raises(TypeError):
+            quotes.selectors["items"] = ".changed"
@@ -7,12 +7,42 @@ Tests the basic paginated crawler functionality.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch, mock_open
+from unittest.mock import Mock, AsyncMock, call, patch, mock_open
 import json
 import csv
+import orjson
+from dataclasses import replace
 from io import StringIO
-
-from app.core.crawler import CrawlerConfig, PaginatedCrawler
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.core.crawler import (
+    CrawlerConfig,
+    PaginatedCrawler,
+    _json_default,
+    run_crawl,
+)
+from app.tests.fakes import FakeElement, FakePage
+
+QUOTES = [
+    FakeElement(fields={".text": "Test quote 1", ".author": "Author 1"}),
+    FakeElement(fields={".text": "Test quote 2", ".author": "Author 2"}),
+]
+
+
+def _pagination_page(crawler, candidates, clickable):
+    """
+    A mock page where the pagination selector matches candidates, of which
+    only clickable pass the crawler's clickable-candidate filter
+    """
+    fake = FakePage(
+        {
+            crawler.config.pagination_selector: candidates,
+            crawler._pagination_selector: clickable,
+        }
+    )
+    page = AsyncMock()
+    page.locator = Mock(side_effect=fake.locator)
+    return page
 
 
 class TestCrawlerConfig:
@@ -54,6 +84,35 @@ class TestCrawlerConfig:
         assert config.headless is False
         assert config.output_format == "json"
         assert config.output_file == "crawled_data"
+        assert config.max_concurrent_items == 16
+        assert config.batch_extraction is True
+        assert config.max_parallel == 3
+
+    def test_crawler_config_freezes_selectors(self):
+        """Test that selectors are frozen and field pairs are built once"""
+        selectors = {"items": ".item", "title": ".title", "price": ".price"}
+        config = CrawlerConfig(base_url="https://test.com", selectors=selectors)
+
+        selectors["title"] = ".changed"
+        assert config.selectors["title"] == ".title"
+        with pytest.raises(TypeError):
+            config.selectors["title"] = ".changed"
+        assert config.field_selectors == (("title", ".title"), ("price", ".price"))
+        assert config.field_selectors is config.field_selectors
+        assert replace(config, max_pages=1).field_selectors == config.field_selectors
+
+
+class TestRunCrawl:
+    """Test the run_crawl entry point"""
+
+    def test_run_crawl_returns_result(self):
+        """Test that run_crawl drives the coroutine and returns its result"""
+
+        async def crawl():
+            await asyncio.sleep(0)
+            return [{"text": "quote"}]
+
+        assert run_crawl(crawl()) == [{"text": "quote"}]
 
 
 @pytest.mark.asyncio
@@ -75,7 +134,7 @@ class TestPaginatedCrawler:
         crawler = PaginatedCrawler(self.config)
 
         assert crawler.config == self.config
-        assert crawler.data == []
+        assert list(crawler.data) == []
         assert crawler.current_page == 1
         assert crawler.browser is None
         assert crawler.page is None
@@ -118,177 +177,100 @@ class TestPaginatedCrawler:
     async def test_extract_data_from_page_success(self):
         """Test successful data extraction from page"""
         crawler = PaginatedCrawler(self.config)
+        crawler.page = FakePage({".quote": QUOTES})
 
-        # Mock page and elements
-        mock_page = AsyncMock()
-        mock_item1 = AsyncMock()
-        mock_item2 = AsyncMock()
-
-        # Mock text extraction
-        mock_text1 = AsyncMock()
-        mock_text1.text_content = AsyncMock(return_value="Test quote 1")
-        mock_author1 = AsyncMock()
-        mock_author1.text_content = AsyncMock(return_value="Author 1")
-
-        mock_text2 = AsyncMock()
-        mock_text2.text_content = AsyncMock(return_value="Test quote 2")
-        mock_author2 = AsyncMock()
-        mock_author2.text_content = AsyncMock(return_value="Author 2")
-
-        mock_item1.query_selector = AsyncMock(
-            side_effect=lambda sel: {".text": mock_text1, ".author": mock_author1}.get(
-                sel
-            )
-        )
+        result = await crawler.extract_data_from_page()
 
-        mock_item2.query_selector = AsyncMock(
-            side_effect=lambda sel: {".text": mock_text2, ".author": mock_author2}.get(
-                sel
-            )
-        )
+        assert len(result) == 2
+        assert result[0] == {"text": "Test quote 1", "author": "Author 1"}
+        assert result[1] == {"text": "Test quote 2", "author": "Author 2"}
+        # The whole page is extracted by one evaluate_all on the items locator
+        assert crawler.page.locator_calls == [".quote"]
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_item1, mock_item2])
-        crawler.page = mock_page
+    async def test_extract_data_from_page_per_element(self):
+        """Test per-element extraction when batching is disabled"""
+        crawler = PaginatedCrawler(replace(self.config, batch_extraction=False))
+        crawler.page = FakePage({".quote": QUOTES})
 
         result = await crawler.extract_data_from_page()
 
         assert len(result) == 2
         assert result[0] == {"text": "Test quote 1", "author": "Author 1"}
         assert result[1] == {"text": "Test quote 2", "author": "Author 2"}
+        assert crawler.page.locator_calls == [".quote"]
 
-    async def test_extract_data_from_page_with_missing_elements(self):
-        """Test data extraction when some elements are missing"""
+    async def test_extract_data_from_page_falls_back_when_evaluate_fails(self):
+        """Test that a failing batch script falls back to per-element extraction"""
         crawler = PaginatedCrawler(self.config)
-
-        # Mock page and elements
-        mock_page = AsyncMock()
-        mock_item = AsyncMock()
-
-        # Mock text element exists but author doesn't
-        mock_text = AsyncMock()
-        mock_text.text_content = AsyncMock(return_value="Test quote")
-
-        mock_item.query_selector = AsyncMock(
-            side_effect=lambda sel: {
-                ".text": mock_text,
-                ".author": None,  # Missing author element
-            }.get(sel)
+        crawler.page = FakePage(
+            {".quote": QUOTES[:1]}, evaluate_error=Exception("eval blocked")
         )
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_item])
-        crawler.page = mock_page
-
         result = await crawler.extract_data_from_page()
 
-        assert len(result) == 1
-        assert result[0] == {"text": "Test quote", "author": None}
-
-    async def test_is_element_clickable_disabled_attribute(self):
-        """Test element clickability check with disabled attribute"""
-        crawler = PaginatedCrawler(self.config)
-
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(
-            side_effect=lambda attr: {"disabled": "true"}.get(  # Element is disabled
-                attr
-            )
-        )
-
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is False
+        assert result == [{"text": "Test quote 1", "author": "Author 1"}]
 
-    async def test_is_element_clickable_aria_disabled(self):
-        """Test element clickability check with aria-disabled"""
-        crawler = PaginatedCrawler(self.config)
+    async def test_extract_data_from_page_with_missing_elements(self):
+        """Test data extraction when some elements are missing"""
+        crawler = PaginatedCrawler(replace(self.config, batch_extraction=False))
 
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(
-            side_effect=lambda attr: {"disabled": None, "aria-disabled": "true"}.get(
-                attr
-            )
+        # Text element exists but author doesn't
+        crawler.page = FakePage(
+            {".quote": [FakeElement(fields={".text": "Test quote"})]}
         )
 
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is False
-
-    async def test_is_element_clickable_disabled_class(self):
-        """Test element clickability check with disabled class"""
-        crawler = PaginatedCrawler(self.config)
-
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(
-            side_effect=lambda attr: {
-                "disabled": None,
-                "aria-disabled": None,
-                "class": "btn btn-disabled",
-            }.get(attr)
-        )
+        result = await crawler.extract_data_from_page()
 
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is False
+        assert len(result) == 1
+        assert result[0] == {"text": "Test quote", "author": None}
 
-    async def test_is_element_clickable_not_visible(self):
-        """Test element clickability check with invisible element"""
+    async def test_locator_cache_reuse(self):
+        """Test that selector locators are built once and reused across pages"""
+        crawler = PaginatedCrawler(replace(self.config, batch_extraction=False))
+        crawler.page = FakePage({".quote": QUOTES})
+
+        await crawler.extract_data_from_page()
+        cache_size = len(crawler._locator_cache)
+        await crawler.extract_data_from_page()
+
+        assert cache_size == 1
+        assert len(crawler._locator_cache) == cache_size
+        assert crawler.page.locator_calls == [".quote"]
+
+    @pytest.mark.parametrize(
+        "reason",
+        [
+            "disabled attribute",
+            "aria-disabled",
+            "disabled class: btn btn-disabled",
+            "not visible",
+            "pointer-events: none",
+            "very low opacity: 0.05",
+        ],
+    )
+    async def test_is_element_clickable_rejected(self, reason):
+        """Test element clickability check when the page reports a blocker"""
         crawler = PaginatedCrawler(self.config)
+        element = FakeElement("Next", unclickable_reason=reason)
 
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(return_value=None)
-        mock_element.is_visible = AsyncMock(return_value=False)
-
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is False
+        assert await crawler._is_element_clickable(element) is False
 
-    async def test_is_element_clickable_pointer_events_none(self):
-        """Test element clickability check with pointer-events: none"""
+    async def test_is_element_clickable_success(self):
+        """Test element clickability check with clickable element"""
         crawler = PaginatedCrawler(self.config)
 
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(return_value=None)
-        mock_element.is_visible = AsyncMock(return_value=True)
-        mock_element.evaluate = AsyncMock(
-            side_effect=lambda script: {
-                "el => getComputedStyle(el).pointerEvents": "none",
-                "el => getComputedStyle(el).opacity": "1",
-            }.get(script)
-        )
-
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is False
+        assert await crawler._is_element_clickable(FakeElement("Next")) is True
 
-    async def test_is_element_clickable_low_opacity(self):
-        """Test element clickability check with very low opacity"""
+    async def test_is_element_clickable_evaluate_error(self):
+        """Test element clickability check when the element is detached"""
         crawler = PaginatedCrawler(self.config)
 
         mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(return_value=None)
-        mock_element.is_visible = AsyncMock(return_value=True)
-        mock_element.evaluate = AsyncMock(
-            side_effect=lambda script: {
-                "el => getComputedStyle(el).pointerEvents": "auto",
-                "el => getComputedStyle(el).opacity": "0.05",
-            }.get(script)
-        )
+        mock_element.evaluate = AsyncMock(side_effect=Exception("detached"))
 
         result = await crawler._is_element_clickable(mock_element)
         assert result is False
 
-    async def test_is_element_clickable_success(self):
-        """Test element clickability check with clickable element"""
-        crawler = PaginatedCrawler(self.config)
-
-        mock_element = AsyncMock()
-        mock_element.get_attribute = AsyncMock(return_value=None)
-        mock_element.is_visible = AsyncMock(return_value=True)
-        mock_element.evaluate = AsyncMock(
-            side_effect=lambda script: {
-                "el => getComputedStyle(el).pointerEvents": "auto",
-                "el => getComputedStyle(el).opacity": "1",
-            }.get(script)
-        )
-
-        result = await crawler._is_element_clickable(mock_element)
-        assert result is True
-
     async def test_navigate_to_next_page_no_pagination_selector(self):
         """Test navigation when no pagination selector is configured"""
         config = CrawlerConfig(
@@ -304,10 +286,7 @@ class TestPaginatedCrawler:
     async def test_navigate_to_next_page_no_elements_found(self):
         """Test navigation when pagination elements are not found"""
         crawler = PaginatedCrawler(self.config)
-
-        mock_page = AsyncMock()
-        mock_page.query_selector_all = AsyncMock(return_value=[])
-        crawler.page = mock_page
+        crawler.page = _pagination_page(crawler, [], [])
 
         result = await crawler.navigate_to_next_page()
         assert result is False
@@ -316,32 +295,82 @@ class TestPaginatedCrawler:
     async def test_navigate_to_next_page_success(self, mock_sleep):
         """Test successful navigation to next page"""
         crawler = PaginatedCrawler(self.config)
+        # The selector filters candidates, so the in-page check must not run
+        element = FakeElement("Next", unclickable_reason="checked in page")
+        mock_page = _pagination_page(crawler, [element], [element])
+        crawler.page = mock_page
+        crawler.current_page = 1
 
-        mock_page = AsyncMock()
-        mock_element = AsyncMock()
-        mock_element.text_content = AsyncMock(return_value="Next")
-        mock_element.get_attribute = AsyncMock(return_value=None)
-        mock_element.is_visible = AsyncMock(return_value=True)
-        mock_element.evaluate = AsyncMock(
-            side_effect=lambda script: {
-                "el => getComputedStyle(el).pointerEvents": "auto",
-                "el => getComputedStyle(el).opacity": "1",
-            }.get(script)
+        result = await crawler.navigate_to_next_page()
+
+        assert result is True
+        assert crawler.current_page == 2
+        assert element.clicks == 1
+        mock_page.wait_for_load_state.assert_has_calls(
+            [call("domcontentloaded"), call("networkidle", timeout=2000)]
         )
+        mock_sleep.assert_called_once_with(pytest.approx(0.0))
+        assert crawler._next_request_at > 0
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_navigate_to_next_page_network_never_idle(self, mock_sleep):
+        """Test that a networkidle timeout does not fail navigation"""
+        crawler = PaginatedCrawler(self.config)
+        element = FakeElement("Next")
+        mock_page = _pagination_page(crawler, [element], [element])
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
-        mock_page.wait_for_load_state = AsyncMock()
+        async def wait_for_load_state(state, timeout=None):
+            if state == "networkidle":
+                raise PlaywrightTimeoutError("Timeout 2000ms exceeded")
 
+        mock_page.wait_for_load_state = AsyncMock(side_effect=wait_for_load_state)
         crawler.page = mock_page
-        crawler.current_page = 1
 
         result = await crawler.navigate_to_next_page()
 
         assert result is True
         assert crawler.current_page == 2
-        mock_element.click.assert_called_once()
-        mock_page.wait_for_load_state.assert_called_once_with("networkidle")
-        mock_sleep.assert_called_once()
+
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    async def test_navigate_to_next_page_stops_at_disabled_first_candidate(
+        self, mock_sleep
+    ):
+        """Test that a disabled "next" is not skipped in favour of "prev" """
+        crawler = PaginatedCrawler(
+            replace(self.config, pagination_selector=".pagination a")
+        )
+        next_link = FakeElement("Next", unclickable_reason="disabled class: disabled")
+        prev_link = FakeElement("Prev")
+        crawler.page = _pagination_page(crawler, [next_link, prev_link], [prev_link])
+
+        result = await crawler.navigate_to_next_page()
+
+        assert result is False
+        assert crawler.current_page == 1
+        assert prev_link.clicks == 0
+
+    def test_pagination_selector_filters_unclickable(self):
+        """Test that the pagination selector is narrowed to clickable elements"""
+        crawler = PaginatedCrawler(replace(self.config, pagination_selector=".next a"))
+
+        selector = crawler._pagination_selector
+        assert selector.startswith(":is(.next a):visible")
+        assert ":not([disabled])" in selector
+        assert ":not([aria-disabled='true'])" in selector
+        assert ":not([class*='disabled' i])" in selector
+
+    @pytest.mark.parametrize("reason", [None, "pointer-events: none"])
+    async def test_navigate_to_next_page_strict_clickability(self, reason):
+        """Test that strict mode runs the full clickability check"""
+        crawler = PaginatedCrawler(replace(self.config, strict_clickability=True))
+        element = FakeElement("Next", unclickable_reason=reason)
+        crawler.page = FakePage({".next": [element]})
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = await crawler.navigate_to_next_page()
+
+        assert result is (reason is None)
+        assert element.clicks == (1 if reason is None else 0)
 
     def test_save_data_no_data(self):
         """Test save_data when no data exists"""
@@ -352,25 +381,46 @@ class TestPaginatedCrawler:
         crawler.save_data()
 
     @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    def test_save_data_json_format(self, mock_json_dump, mock_file):
+    @patch("app.core.crawler.orjson.dumps", return_value=b"[]")
+    def test_save_data_json_format(self, mock_dumps, mock_file):
         """Test saving data in JSON format"""
         crawler = PaginatedCrawler(self.config)
         crawler.data = [{"text": "quote1", "author": "author1"}]
 
         crawler.save_data("test_output.json")
 
-        mock_file.assert_called_once_with("test_output.json", "w", encoding="utf-8")
-        mock_json_dump.assert_called_once_with(
+        mock_file.assert_called_once_with("test_output.json", "wb")
+        mock_dumps.assert_called_once_with(
             crawler.data,
-            mock_file.return_value.__enter__.return_value,
-            indent=2,
-            ensure_ascii=False,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+        mock_file.return_value.__enter__.return_value.write.assert_called_once_with(
+            b"[]"
         )
 
+    def test_save_data_json_rejects_unsupported_values(self, tmp_path):
+        """Test that only the deque is converted, not arbitrary iterables"""
+        crawler = PaginatedCrawler(self.config)
+        crawler.data.append({"tags": {"a", "b"}})
+
+        with pytest.raises(TypeError):
+            crawler.save_data(str(tmp_path / "out.json"))
+
+    def test_save_data_json_roundtrip(self, tmp_path):
+        """Test that saved JSON keeps non-ASCII text readable"""
+        crawler = PaginatedCrawler(self.config)
+        crawler.data.append({"text": "“Zitat” – ünïcode", "author": None})
+        output = tmp_path / "out.json"
+
+        crawler.save_data(str(output))
+
+        assert "ünïcode" in output.read_text(encoding="utf-8")
+        assert json.loads(output.read_bytes()) == crawler.get_data()
+
     @patch("builtins.open", new_callable=mock_open)
-    @patch("csv.DictWriter")
-    def test_save_data_csv_format(self, mock_dict_writer, mock_file):
+    @patch("csv.writer")
+    def test_save_data_csv_format(self, mock_csv_writer, mock_file):
         """Test saving data in CSV format"""
         config = CrawlerConfig(
             base_url="https://test.com",
@@ -380,30 +430,84 @@ class TestPaginatedCrawler:
         crawler = PaginatedCrawler(config)
         crawler.data = [
             {"text": "quote1", "author": "author1"},
-            {"text": "quote2", "author": "author2"},
+            {"text": "quote2"},
         ]
 
         mock_writer = Mock()
-        mock_dict_writer.return_value = mock_writer
+        mock_csv_writer.return_value = mock_writer
 
         crawler.save_data("test_output.csv")
 
         mock_file.assert_called_once_with(
             "test_output.csv", "w", newline="", encoding="utf-8"
         )
-        mock_dict_writer.assert_called_once_with(
-            mock_file.return_value.__enter__.return_value, fieldnames=["text", "author"]
+        mock_csv_writer.assert_called_once_with(
+            mock_file.return_value.__enter__.return_value
         )
-        mock_writer.writeheader.assert_called_once()
-        mock_writer.writerows.assert_called_once_with(crawler.data)
+        mock_writer.writerow.assert_called_once_with(["text", "author"])
+        mock_writer.writerows.assert_called_once()
+
+    def test_save_data_csv_rows(self, tmp_path):
+        """Test CSV rows are written in column order with blanks for gaps"""
+        config = CrawlerConfig(
+            base_url="https://test.com",
+            selectors={"items": ".item"},
+            output_format="csv",
+        )
+        crawler = PaginatedCrawler(config)
+        crawler.data = [
+            {"text": "quote1", "author": "author1"},
+            {"text": "quote2"},
+        ]
+        output = tmp_path / "out.csv"
+
+        crawler.save_data(str(output))
+
+        with open(output, newline="", encoding="utf-8") as f:
+            assert list(csv.reader(f)) == [
+                ["text", "author"],
+                ["quote1", "author1"],
+                ["quote2", ""],
+            ]
+
+    def test_save_data_csv_keeps_later_columns(self, tmp_path):
+        """Test CSV columns include keys that only appear in later rows"""
+        config = CrawlerConfig(
+            base_url="https://test.com",
+            selectors={"items": ".item"},
+            output_format="csv",
+        )
+        crawler = PaginatedCrawler(config)
+        crawler.data = [{"text": "quote1"}, {"author": "author2", "text": "quote2"}]
+        output = tmp_path / "out.csv"
+
+        crawler.save_data(str(output))
+
+        with open(output, newline="", encoding="utf-8") as f:
+            assert list(csv.reader(f)) == [
+                ["text", "author"],
+                ["quote1", ""],
+                ["quote2", "author2"],
+            ]
+
+    async def test_save_data_async_json(self, tmp_path):
+        """Test that save_data_async writes the same file off the event loop"""
+        crawler = PaginatedCrawler(self.config)
+        crawler.data.extend([{"text": "quote1", "author": "author1"}])
+        output = tmp_path / "out.json"
+
+        await crawler.save_data_async(str(output))
+
+        assert json.loads(output.read_bytes()) == crawler.get_data()
 
     def test_get_data(self):
         """Test get_data method"""
         crawler = PaginatedCrawler(self.config)
         test_data = [{"text": "quote1", "author": "author1"}]
-        crawler.data = test_data
+        crawler.data.extend(test_data)
 
         result = crawler.get_data()
+        assert isinstance(result, list)
         assert result == test_data
 
     @patch("app.core.crawler.async_playwright")
@@ -442,6 +546,96 @@ class TestPaginatedCrawler:
                 crawler.navigate_to_next_page.call_count == 2
             )  # Called once, then stopped by max_pages
 
+    async def test_crawl_overlaps_delay_with_extraction(self):
+        """Test that time spent extracting counts towards the politeness delay"""
+        crawler = PaginatedCrawler(replace(self.config, max_pages=3, delay_ms=1000))
+        element = FakeElement("Next")
+        crawler.page = _pagination_page(crawler, [element], [element])
+
+        clock = [0.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        async def fake_extract():
+            clock[0] += 0.4  # Each page takes 400ms to extract
+            return [{"text": "quote", "author": "author"}]
+
+        crawler.extract_data_from_page = fake_extract
+
+        with (
+            patch("asyncio.sleep", new=fake_sleep),
+            patch("app.core.crawler.time.monotonic", side_effect=lambda: clock[0]),
+        ):
+            result = await crawler.crawl()
+
+        assert len(result) == 3
+        # No delay before the first click, then only what extraction left over
+        assert sleeps == [0.0, pytest.approx(0.6)]
+
+    @patch("app.core.crawler.async_playwright")
+    async def test_crawl_parallel(self, mock_playwright):
+        """Test crawling a URL list with a bounded number of browser contexts"""
+        mock_playwright_instance = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright_instance
+        )
+        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        in_flight = 0
+        peak = 0
+
+        def new_context():
+            async def goto(url):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+            page = AsyncMock()
+            page.goto = AsyncMock(side_effect=goto)
+            items = Mock()
+            items.evaluate_all = AsyncMock(
+                side_effect=lambda script, fields: [{"text": page.goto.call_args[0][0]}]
+            )
+            page.locator = Mock(return_value=items)
+            context = AsyncMock()
+            context.new_page = AsyncMock(return_value=page)
+            return context
+
+        mock_browser.new_context = AsyncMock(side_effect=new_context)
+
+        urls = [f"https://test.com/?page={n}" for n in range(1, 5)]
+        crawler = PaginatedCrawler(replace(self.config, max_parallel=2, delay_ms=0))
+
+        async with crawler:
+            result = await crawler.crawl_parallel(urls)
+
+        assert result == [{"text": url} for url in urls]
+        assert mock_browser.new_context.call_count == len(urls)
+        assert peak == 2
+
+    async def test_crawl_parallel_spaces_requests(self):
+        """Test that parallel page loads still start delay_ms apart"""
+        # No items selector, so each page is loaded but nothing is extracted
+        crawler = PaginatedCrawler(replace(self.config, selectors={}, max_parallel=4))
+        crawler.browser = AsyncMock()
+        urls = [f"https://test.com/?page={n}" for n in range(1, 5)]
+
+        with (
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("app.core.crawler.time.monotonic", return_value=10.0),
+        ):
+            await crawler.crawl_parallel(urls)
+
+        waits = sorted(c.args[0] for c in mock_sleep.call_args_list)
+        assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+        assert crawler._next_request_at == pytest.approx(10.4)
+
     @patch("app.core.crawler.async_playwright")
     async def test_crawl_no_more_pages(self, mock_playwright):
         """Test crawling when no more pages are available"""
@@ -6,309 +6,375 @@ Tests the example scripts and demo functionality.
 """
 
 import pytest
-import asyncio
-from unittest.mock import Mock, AsyncMock, patch, call
+import re
+from collections import Counter
+from dataclasses import dataclass, fields, is_dataclass
+from types import SimpleNamespace
+from typing import Any, Union, get_args, get_origin
+from urllib.parse import urlsplit
 
 from app.examples.workflow_examples import WorkflowExamples
-from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
+from app.models import CrawlerConfiguration
+
+# Same checks as substring tests for ".", "#", "[", " ", ">", ":", "a", "div",
+# "span" and "p" ("span" is already covered by "a" and "p")
+_VALID_SELECTOR_RE = re.compile(r"[.#\[ >:ap]|div")
+_PLACEHOLDER_RE = re.compile(r"TODO|PLACEHOLDER", re.IGNORECASE)
+_JOB_DESC_RE = re.compile(r"job description", re.IGNORECASE)
+_COMPANY_PAGE_RE = re.compile(r"company page", re.IGNORECASE)
+
+# CrawlerConfiguration fields AdvancedCrawler relies on
+_CRAWLER_FIELDS = frozenset(
+    {"name", "base_url", "selections", "workflows", "delay_ms", "max_pages"}
+)
+
+# Words an example's URL should contain, by the first keyword in its name
+_URL_WORDS = {
+    "shop": ("shop", "store", "products"),
+    "job": ("job", "career", "search"),
+    "news": ("news", "article", "latest"),
+    "social": ("social", "feed", "posts"),
+}
+
+EXAMPLE_BUILDERS = {
+    "ecommerce": WorkflowExamples.create_ecommerce_workflow,
+    "jobs": WorkflowExamples.create_job_board_workflow,
+    "news": WorkflowExamples.create_news_site_workflow,
+    "social": WorkflowExamples.create_social_media_workflow,
+}
+
+
+# Built once at import: the builders are deterministic and configurations are
+# frozen, so every test reads the same instances
+_EXAMPLE_CONFIGS = {name: build() for name, build in EXAMPLE_BUILDERS.items()}
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowSpec:
+    """What one pre-built example configuration must look like"""
+
+    key: str
+    name: str
+    base_url: str
+    max_pages: int
+    delay_ms: int
+    workflow_count: int
+    expected_fields: frozenset = frozenset()
+    expected_actions: frozenset = frozenset()
+    expected_step_ids: frozenset = frozenset()
+
+
+WORKFLOW_SPECS = (
+    WorkflowSpec(
+        key="ecommerce",
+        name="E-commerce Product Crawler",
+        base_url="https://example-shop.com/products",
+        max_pages=10,
+        delay_ms=2000,
+        workflow_count=3,
+        expected_actions=frozenset({"click", "open_new_tab"}),
+    ),
+    WorkflowSpec(
+        key="jobs",
+        name="Job Board Crawler",
+        base_url="https://example-jobs.com/search",
+        max_pages=20,
+        delay_ms=1500,
+        workflow_count=2,
+        expected_fields=frozenset(
+            {
+                "job_title",
+                "company",
+                "location",
+                "salary",
+                "job_description",
+                "requirements",
+                "company_info",
+                "benefits",
+            }
+        ),
+    ),
+    WorkflowSpec(
+        key="news",
+        name="News Site Crawler",
+        base_url="https://example-news.com/latest",
+        max_pages=15,
+        delay_ms=1000,
+        workflow_count=2,
+        expected_fields=frozenset(
+            {
+                "headline",
+                "summary",
+                "author",
+                "publish_date",
+                "full_content",
+                "author_bio",
+                "tags",
+                "comments_count",
+            }
+        ),
+        expected_step_ids=frozenset({"read_full_article", "get_author_profile"}),
+    ),
+    WorkflowSpec(
+        key="social",
+        name="Social Media Crawler",
+        base_url="https://example-social.com/feed",
+        max_pages=50,
+        delay_ms=2000,
+        workflow_count=2,
+        expected_fields=frozenset(
+            {
+                "username",
+                "post_text",
+                "timestamp",
+                "likes",
+                "shares",
+                "user_profile",
+                "comments",
+            }
+        ),
+        # User profile and comment expansion workflows
+        expected_actions=frozenset({"click", "open_new_tab"}),
+    ),
+)
+
+# (example, index) pairs enumerated at collection so each selection and each
+# workflow step is reported as its own test
+_SELECTION_IDS = [
+    (name, i)
+    for name, config in _EXAMPLE_CONFIGS.items()
+    for i in range(len(config.selections))
+]
+_WORKFLOW_IDS = [
+    (name, i)
+    for name, config in _EXAMPLE_CONFIGS.items()
+    for i in range(len(config.workflows))
+]
+
+
+@pytest.fixture(scope="session")
+def example_configs():
+    """All pre-built example configurations, keyed by example name"""
+    return _EXAMPLE_CONFIGS
+
+
+@pytest.fixture
+def config(example, example_configs):
+    """The configuration of the parametrized example"""
+    return example_configs[example]
+
+
+@pytest.fixture(scope="session")
+def example_summaries(example_configs):
+    """Selection facts for each example configuration, keyed by example name"""
+    return {name: _summarize(config) for name, config in example_configs.items()}
+
+
+@pytest.fixture
+def summary(example, example_summaries):
+    """Selection facts for the parametrized example configuration"""
+    return example_summaries[example]
+
+
+def _type_errors(value, hint, path: str) -> list:
+    """List values that do not match their model annotation, recursively"""
+    origin, args = get_origin(hint), get_args(hint)
+    if origin is Union:
+        if value is None and type(None) in args:
+            return []
+        hint = next(arg for arg in args if arg is not type(None))
+        return _type_errors(value, hint, path)
+    if origin in (list, dict):
+        if not isinstance(value, origin):
+            return [f"{path}: expected {origin.__name__}"]
+        if origin is dict:
+            return []
+        return [
+            error
+            for i, item in enumerate(value)
+            for error in _type_errors(item, args[0], f"{path}[{i}]")
+        ]
+    if is_dataclass(hint):
+        if not isinstance(value, hint):
+            return [f"{path}: expected {hint.__name__}"]
+        return [
+            error
+            for f in fields(hint)
+            for error in _type_errors(
+                getattr(value, f.name), f.type, f"{path}.{f.name}"
+            )
+        ]
+    if hint is not Any and not isinstance(value, hint):
+        return [f"{path}: expected {hint.__name__}, got {type(value).__name__}"]
+    return []
+
+
+def _summarize(config: CrawlerConfiguration) -> SimpleNamespace:
+    name = config.name.lower()
+    keyword = next((k for k in _URL_WORDS if k in name), None)
+    return SimpleNamespace(
+        data_fields=frozenset(
+            s.name for s in config.selections if s.element_type == "data_field"
+        ),
+        containers=[
+            s for s in config.selections if s.element_type == "items_container"
+        ],
+        type_counts=Counter(s.element_type for s in config.selections),
+        url_parts=urlsplit(config.base_url),
+        url_words=_URL_WORDS.get(keyword, ()),
+    )
 
 
 class TestWorkflowExamples:
     """Test WorkflowExamples class and pre-built configurations"""
 
-    def test_create_ecommerce_workflow(self):
-        """Test e-commerce workflow creation"""
-        config = WorkflowExamples.create_ecommerce_workflow()
-
+    @pytest.mark.parametrize(
+        "example, spec",
+        [(spec.key, spec) for spec in WORKFLOW_SPECS],
+        ids=[spec.key for spec in WORKFLOW_SPECS],
+    )
+    def test_create_workflow(self, spec, config, summary):
+        """Test a pre-built workflow against its spec"""
         assert isinstance(config, CrawlerConfiguration)
-        assert config.name == "E-commerce Product Crawler"
-        assert config.base_url == "https://example-shop.com/products"
-        assert config.max_pages == 10
-        assert config.delay_ms == 2000
+        assert config.name == spec.name
+        assert config.base_url == spec.base_url
+        assert config.max_pages == spec.max_pages
+        assert config.delay_ms == spec.delay_ms
+
+        # Check for example-specific fields
+        assert spec.expected_fields <= summary.data_fields
+
+        # Check workflows
+        assert len(config.workflows) == spec.workflow_count
+        assert spec.expected_actions <= {w.action for w in config.workflows}
+        assert spec.expected_step_ids <= {w.step_id for w in config.workflows}
 
+    @pytest.mark.parametrize("example", ["ecommerce"])
+    def test_ecommerce_selection_structure(self, config, summary):
+        """Test e-commerce selections and pagination"""
         # Check selections structure
-        selection_types = {}
-        for selection in config.selections:
-            selection_types[selection.element_type] = (
-                selection_types.get(selection.element_type, 0) + 1
-            )
+        selection_types = summary.type_counts
 
         assert selection_types["items_container"] == 1
         assert (
             selection_types["data_field"] == 8
         )  # products, title, price, image, rating, description, specifications, reviews, seller_info
 
-        # Check workflows
-        assert len(config.workflows) == 3
-        workflow_actions = [w.action for w in config.workflows]
-        assert "click" in workflow_actions
-        assert "open_new_tab" in workflow_actions
-
         # Check pagination config
         assert config.pagination_config is not None
         assert config.pagination_config.selector == ".pagination .next"
 
-    def test_create_job_board_workflow(self):
-        """Test job board workflow creation"""
-        config = WorkflowExamples.create_job_board_workflow()
-
-        assert isinstance(config, CrawlerConfiguration)
-        assert config.name == "Job Board Crawler"
-        assert config.base_url == "https://example-jobs.com/search"
-        assert config.max_pages == 20
-        assert config.delay_ms == 1500
-
-        # Check for job-specific fields
-        field_names = {
-            s.name for s in config.selections if s.element_type == "data_field"
-        }
-        expected_fields = {
-            "job_title",
-            "company",
-            "location",
-            "salary",
-            "job_description",
-            "requirements",
-            "company_info",
-            "benefits",
-        }
-        assert expected_fields.issubset(field_names)
+    def test_job_board_workflow_descriptions(self):
+        """Test job board workflows cover the description and company page"""
+        config = _EXAMPLE_CONFIGS["jobs"]
 
-        # Check workflows
-        assert len(config.workflows) == 2
-        workflow_descriptions = [w.description for w in config.workflows]
-        assert any("job description" in desc.lower() for desc in workflow_descriptions)
-        assert any("company page" in desc.lower() for desc in workflow_descriptions)
-
-    def test_create_news_site_workflow(self):
-        """Test news site workflow creation"""
-        config = WorkflowExamples.create_news_site_workflow()
+        assert any(_JOB_DESC_RE.search(w.description) for w in config.workflows)
+        assert any(_COMPANY_PAGE_RE.search(w.description) for w in config.workflows)
 
+    @pytest.mark.parametrize("example", EXAMPLE_BUILDERS)
+    def test_example_config_has_required_elements(self, config, summary):
+        """Test that each example configuration has required elements"""
+        # Each config should have basic required elements
         assert isinstance(config, CrawlerConfiguration)
-        assert config.name == "News Site Crawler"
-        assert config.base_url == "https://example-news.com/latest"
-        assert config.max_pages == 15
-        assert config.delay_ms == 1000
+        assert config.name
+        assert summary.url_parts.scheme in ("http", "https")
+        assert len(config.selections) > 0
 
-        # Check for news-specific fields
-        field_names = {
-            s.name for s in config.selections if s.element_type == "data_field"
-        }
-        expected_fields = {
-            "headline",
-            "summary",
-            "author",
-            "publish_date",
-            "full_content",
-            "author_bio",
-            "tags",
-            "comments_count",
-        }
-        assert expected_fields.issubset(field_names)
-
-        # Check workflows for news-specific actions
-        assert len(config.workflows) == 2
-        step_ids = [w.step_id for w in config.workflows]
-        assert "read_full_article" in step_ids
-        assert "get_author_profile" in step_ids
-
-    def test_create_social_media_workflow(self):
-        """Test social media workflow creation"""
-        config = WorkflowExamples.create_social_media_workflow()
+        # Should have at least one items container
+        assert len(summary.containers) >= 1
 
-        assert isinstance(config, CrawlerConfiguration)
-        assert config.name == "Social Media Crawler"
-        assert config.base_url == "https://example-social.com/feed"
-        assert config.max_pages == 50
-        assert config.delay_ms == 2000
+        # Should have at least one data field
+        assert summary.type_counts["data_field"] >= 1
 
-        # Check for social media-specific fields
-        field_names = {
-            s.name for s in config.selections if s.element_type == "data_field"
-        }
-        expected_fields = {
-            "username",
-            "post_text",
-            "timestamp",
-            "likes",
-            "shares",
-            "user_profile",
-            "comments",
-        }
-        assert expected_fields.issubset(field_names)
+        # Should have workflows for complex extraction
+        assert len(config.workflows) >= 1
 
-        # Check workflows
-        assert len(config.workflows) == 2
-
-        # Should have user profile and comment expansion workflows
-        actions = [w.action for w in config.workflows]
-        assert "open_new_tab" in actions
-        assert "click" in actions
-
-    def test_all_example_configs_have_required_elements(self):
-        """Test that all example configurations have required elements"""
-        examples = WorkflowExamples()
-
-        configs = [
-            examples.create_ecommerce_workflow(),
-            examples.create_job_board_workflow(),
-            examples.create_news_site_workflow(),
-            examples.create_social_media_workflow(),
-        ]
 
-        for config in configs:
-            # Each config should have basic required elements
-            assert isinstance(config, CrawlerConfiguration)
-            assert config.name
-            assert config.base_url.startswith(("http://", "https://"))
-            assert len(config.selections) > 0
+class TestExampleConfigurationRealism:
+    """Test that example configurations are realistic and well-structured"""
 
-            # Should have at least one items container
-            items_containers = [
-                s for s in config.selections if s.element_type == "items_container"
-            ]
-            assert len(items_containers) >= 1
+    def test_configuration_declares_crawler_fields(self):
+        """Test that the model declares every field AdvancedCrawler reads"""
+        declared = {f.name for f in fields(CrawlerConfiguration)}
+        assert _CRAWLER_FIELDS <= declared
 
-            # Should have at least one data field
-            data_fields = [
-                s for s in config.selections if s.element_type == "data_field"
-            ]
-            assert len(data_fields) >= 1
+    @pytest.mark.parametrize("example", EXAMPLE_BUILDERS)
+    def test_field_types_match_models(self, config):
+        """Test every field of an example against its model annotation"""
+        assert _type_errors(config, CrawlerConfiguration, "config") == []
 
-            # Should have workflows for complex extraction
-            assert len(config.workflows) >= 1
+    @pytest.mark.parametrize("name, index", _SELECTION_IDS)
+    def test_selector_realism(self, example_configs, name, index):
+        """Test that a selector in an example is a realistic CSS selector"""
+        selector = example_configs[name].selections[index].selector
 
+        # Should be valid CSS selector format
+        assert len(selector) > 0
 
-class TestExampleConfigurationRealism:
-    """Test that example configurations are realistic and well-structured"""
+        # Should contain realistic CSS patterns
+        assert _VALID_SELECTOR_RE.search(selector)
 
-    def test_selector_realism(self):
-        """Test that selectors in examples are realistic CSS selectors"""
-        examples = WorkflowExamples()
-        configs = [
-            examples.create_ecommerce_workflow(),
-            examples.create_job_board_workflow(),
-            examples.create_news_site_workflow(),
-            examples.create_social_media_workflow(),
-        ]
+        # Should not contain obvious placeholders
+        assert not _PLACEHOLDER_RE.search(selector)
 
-        for config in configs:
-            for selection in config.selections:
-                selector = selection.selector
-
-                # Should be valid CSS selector format
-                assert isinstance(selector, str)
-                assert len(selector) > 0
-
-                # Should contain realistic CSS patterns
-                valid_patterns = [".", "#", "[", " ", ">", ":", "a", "div", "span", "p"]
-                assert any(pattern in selector for pattern in valid_patterns)
-
-                # Should not contain obvious placeholders
-                assert "TODO" not in selector.upper()
-                assert "PLACEHOLDER" not in selector.upper()
-
-    def test_workflow_step_realism(self):
-        """Test that workflow steps are realistic and actionable"""
-        examples = WorkflowExamples()
-        configs = [
-            examples.create_ecommerce_workflow(),
-            examples.create_job_board_workflow(),
-            examples.create_news_site_workflow(),
-            examples.create_social_media_workflow(),
-        ]
+    @pytest.mark.parametrize("name, index", _WORKFLOW_IDS)
+    def test_workflow_step_realism(self, example_configs, name, index):
+        """Test that a workflow step is realistic and actionable"""
+        workflow = example_configs[name].workflows[index]
 
-        for config in configs:
-            for workflow in config.workflows:
-                # Should have realistic step ID
-                assert isinstance(workflow.step_id, str)
-                assert len(workflow.step_id) > 0
-                assert "_" in workflow.step_id or workflow.step_id.islower()
+        # Should have realistic step ID
+        assert len(workflow.step_id) > 0
+        assert "_" in workflow.step_id or workflow.step_id.islower()
 
-                # Should have valid action
-                assert workflow.action in ["click", "extract", "open_new_tab"]
+        # Should have valid action
+        assert workflow.action in ["click", "extract", "open_new_tab"]
 
-                # Should have realistic target selector
-                assert isinstance(workflow.target_selector, str)
-                assert len(workflow.target_selector) > 0
+        # Should have realistic target selector
+        assert len(workflow.target_selector) > 0
 
-                # Should have meaningful description
-                assert isinstance(workflow.description, str)
-                assert len(workflow.description) > 10
+        # Should have meaningful description
+        assert len(workflow.description) > 10
 
-                # If has extract fields, they should be meaningful
-                if workflow.extract_fields:
-                    assert isinstance(workflow.extract_fields, list)
-                    assert len(workflow.extract_fields) > 0
-                    for field in workflow.extract_fields:
-                        assert isinstance(field, str)
-                        assert len(field) > 0
+        # If has extract fields, they should be meaningful
+        if workflow.extract_fields:
+            assert len(workflow.extract_fields) > 0
+            for field in workflow.extract_fields:
+                assert len(field) > 0
 
-    def test_url_structure_realism(self):
+    @pytest.mark.parametrize("example", EXAMPLE_BUILDERS)
+    def test_url_structure_realism(self, summary):
         """Test that example URLs follow realistic patterns"""
-        examples = WorkflowExamples()
-        configs = [
-            examples.create_ecommerce_workflow(),
-            examples.create_job_board_workflow(),
-            examples.create_news_site_workflow(),
-            examples.create_social_media_workflow(),
-        ]
-
-        for config in configs:
-            base_url = config.base_url
+        url_parts = summary.url_parts
 
-            # Should be valid URL format
-            assert base_url.startswith(("http://", "https://"))
-            assert "." in base_url  # Should have domain
+        # Should be valid URL format
+        assert url_parts.scheme in ("http", "https")
+        assert "." in url_parts.netloc  # Should have domain
 
-            # Should have realistic domain patterns
-            if "shop" in config.name.lower():
-                assert any(word in base_url for word in ["shop", "store", "products"])
-            elif "job" in config.name.lower():
-                assert any(word in base_url for word in ["job", "career", "search"])
-            elif "news" in config.name.lower():
-                assert any(word in base_url for word in ["news", "article", "latest"])
-            elif "social" in config.name.lower():
-                assert any(word in base_url for word in ["social", "feed", "posts"])
+        # Should have realistic domain patterns
+        if summary.url_words:
+            location = url_parts.netloc + url_parts.path
+            assert any(word in location for word in summary.url_words)
 
-    def test_configuration_completeness(self):
+    @pytest.mark.parametrize("example", EXAMPLE_BUILDERS)
+    def test_configuration_completeness(self, config, summary):
         """Test that each example configuration is complete and usable"""
-        examples = WorkflowExamples()
-        configs = [
-            examples.create_ecommerce_workflow(),
-            examples.create_job_board_workflow(),
-            examples.create_news_site_workflow(),
-            examples.create_social_media_workflow(),
-        ]
+        # Should have logical field relationships
+        if config.workflows:
+            # All workflow extract_fields should reference actual data fields
+            data_field_names = summary.data_fields
 
-        for config in configs:
-            # Should have all required fields for AdvancedCrawler
-            assert hasattr(config, "name")
-            assert hasattr(config, "base_url")
-            assert hasattr(config, "selections")
-            assert hasattr(config, "workflows")
-
-            # Should have logical field relationships
-            if config.workflows:
-                # All workflow extract_fields should reference actual data fields
-                data_field_names = {
-                    s.name for s in config.selections if s.element_type == "data_field"
-                }
-
-                for workflow in config.workflows:
-                    if workflow.extract_fields:
-                        for field in workflow.extract_fields:
-                            # Field should either exist in selections or be a reasonable field name
-                            assert (
-                                field in data_field_names
-                                or isinstance(field, str)
-                                and len(field) > 0
-                            )
-
-            # Should have reasonable timing settings
-            if hasattr(config, "delay_ms"):
-                assert config.delay_ms >= 100  # Not too fast
-                assert config.delay_ms <= 10000  # Not too slow
-
-            if hasattr(config, "max_pages"):
-                assert config.max_pages is None or config.max_pages > 0
+            for workflow in config.workflows:
+                if workflow.extract_fields:
+                    for field in workflow.extract_fields:
+                        # Field should either exist in selections or be a reasonable field name
+                        assert (
+                            field in data_field_names
+                            or isinstance(field, str)
+                            and len(field) > 0
+                        )
+
+        # Should have reasonable timing settings
+        assert config.delay_ms >= 100  # Not too fast
+        assert config.delay_ms <= 10000  # Not too slow
+
+        assert config.max_pages is None or config.max_pages > 0
@@ -6,11 +6,11 @@ Tests end-to-end functionality across multiple components.
 """
 
 import pytest
-import asyncio
-import tempfile
 import os
-import json
-from unittest.mock import Mock, AsyncMock, patch
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import fields
+import orjson
 
 from app.core.crawler import PaginatedCrawler, CrawlerConfig
 from app.core.config import PresetConfigs
@@ -19,7 +19,56 @@ from app.interactive.configurator import WorkflowConfigurator
 from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
 
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def product_selections():
+    """Read-only product selections shared by the module's tests"""
+    return [
+        ElementSelection("items", ".product", "items_container", "Products"),
+        ElementSelection("title", ".title", "data_field", "Title"),
+        ElementSelection("price", ".price", "data_field", "Price"),
+        ElementSelection("detail", ".detail", "data_field", "Detail description"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def product_workflows():
+    """Read-only product workflow steps shared by the module's tests"""
+    return [
+        WorkflowStep(
+            step_id="get_details",
+            action="click",
+            target_selector=".detail-link",
+            description="Get product details",
+            extract_fields=["detail"],
+            wait_condition="networkidle",
+        )
+    ]
+
+
+@pytest.fixture(scope="module")
+def product_config(product_selections, product_workflows):
+    """Configuration over the shared product selections and workflows"""
+    return CrawlerConfiguration(
+        name="Integration Test",
+        base_url="https://test.com",
+        selections=product_selections,
+        workflows=product_workflows,
+        max_pages=1,
+    )
+
+
+@pytest.fixture(scope="module")
+def product_crawler(product_config):
+    """AdvancedCrawler over product_config; read-only, no browser is launched"""
+    return AdvancedCrawler(product_config, headless=True)
+
+
+@pytest.fixture
+def configurator(tmp_path):
+    """WorkflowConfigurator that keeps its files in tmp_path"""
+    return WorkflowConfigurator(config_directory=str(tmp_path))
+
+
 class TestBasicCrawlerIntegration:
     """Test integration between config and basic crawler"""
 
@@ -54,75 +103,48 @@ class TestBasicCrawlerIntegration:
             PresetConfigs.reddit_subreddit("python"),
         ]
 
+        required = {"name", "base_url", "selectors", "pagination_selector", "delay_ms"}
+
         for preset in presets:
             # Check required fields
-            assert hasattr(preset, "name")
-            assert hasattr(preset, "base_url")
-            assert hasattr(preset, "selectors")
-            assert isinstance(preset.selectors, dict)
+            assert required <= {f.name for f in fields(preset)}
+            assert isinstance(preset.selectors, Mapping)
             assert "items" in preset.selectors
 
             # Check URL validity
             assert preset.base_url.startswith(("http://", "https://"))
 
-            # Check pagination is configured
-            assert hasattr(preset, "pagination_selector")
-
             # Check timing settings
-            assert hasattr(preset, "delay_ms")
             assert isinstance(preset.delay_ms, int)
             assert preset.delay_ms > 0
 
 
-@pytest.mark.asyncio
 class TestAdvancedCrawlerIntegration:
     """Test integration of advanced crawler components"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.selections = [
-            ElementSelection("items", ".product", "items_container", "Products"),
-            ElementSelection("title", ".title", "data_field", "Title"),
-            ElementSelection("price", ".price", "data_field", "Price"),
-            ElementSelection("detail", ".detail", "data_field", "Detail description"),
-        ]
-
-        self.workflows = [
-            WorkflowStep(
-                step_id="get_details",
-                action="click",
-                target_selector=".detail-link",
-                description="Get product details",
-                extract_fields=["detail"],
-                wait_condition="networkidle",
-            )
-        ]
-
-        self.config = CrawlerConfiguration(
-            name="Integration Test",
-            base_url="https://test.com",
-            selections=self.selections,
-            workflows=self.workflows,
-            max_pages=1,
-        )
-
-    def test_configuration_to_crawler_integration(self):
+    def test_configuration_to_crawler_integration(
+        self, product_crawler, product_config
+    ):
         """Test that CrawlerConfiguration integrates properly with AdvancedCrawler"""
-        crawler = AdvancedCrawler(self.config, headless=True)
-
         # Test crawler has access to configuration
-        assert crawler.config == self.config
+        assert product_crawler.config == product_config
 
         # Test helper methods work with configuration
-        items_selector = crawler._get_items_selector()
+        items_selector = product_crawler._get_items_selector()
         assert items_selector is not None
         assert items_selector.selector == ".product"
 
-        title_selection = crawler._find_selection_by_name("title")
-        assert title_selection is not None
-        assert title_selection.selector == ".title"
-
-    def test_workflow_builder_to_configuration_integration(self):
+    @pytest.mark.parametrize(
+        "name, selector",
+        [("title", ".title"), ("price", ".price"), ("detail", ".detail")],
+    )
+    def test_crawler_finds_configured_fields(self, product_crawler, name, selector):
+        """Test that every configured data field is found by name"""
+        selection = product_crawler._find_selection_by_name(name)
+        assert selection is not None
+        assert selection.selector == selector
+
+    def test_workflow_builder_to_configuration_integration(self, product_selections):
         """Test WorkflowBuilder integration with configuration"""
         from app.advanced_crawler import WorkflowBuilder
 
@@ -137,13 +159,13 @@ class TestAdvancedCrawlerIntegration:
         config = CrawlerConfiguration(
             name="Builder Integration",
             base_url="https://test.com",
-            selections=self.selections,
+            selections=product_selections,
             workflows=workflows,
         )
 
         # Verify workflows are properly integrated
         assert len(config.workflows) == 2
-        assert all(isinstance(w, WorkflowStep) for w in config.workflows)
+        assert {type(w) for w in config.workflows} == {WorkflowStep}
         assert config.workflows[0].action == "click"
         assert config.workflows[1].action == "open_new_tab"
 
@@ -151,17 +173,12 @@ class TestAdvancedCrawlerIntegration:
 class TestConfigurationFileIntegration:
     """Test configuration file loading and saving integration"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory"""
+        self.temp_dir = str(tmp_path)
         self.config_file = os.path.join(self.temp_dir, "test_config.json")
 
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
     def test_save_and_load_configuration_roundtrip(self):
         """Test saving and loading configuration preserves all data"""
         # Create complex configuration
@@ -220,12 +237,8 @@ class TestConfigurationFileIntegration:
         )
 
         # Save configuration manually (simulating the save process)
-        from dataclasses import asdict
-
-        config_dict = asdict(original_config)
-
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config_dict, f, indent=2)
+        with open(self.config_file, "wb") as f:
+            f.write(orjson.dumps(original_config, option=orjson.OPT_INDENT_2))
 
         # Load configuration using the function
         loaded_config = load_interactive_config(self.config_file)
@@ -263,24 +276,14 @@ class TestConfigurationFileIntegration:
         )
 
 
-@pytest.mark.asyncio
 class TestWorkflowConfiguratorIntegration:
     """Test integration between WorkflowConfigurator and other components"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-
-        # Patch the config directory to use temp directory
-        with patch.object(WorkflowConfigurator, "_ensure_config_directory"):
-            self.configurator = WorkflowConfigurator()
-            self.configurator.config_directory = self.temp_dir
-
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path, configurator):
+        """Set up test fixtures in pytest's per-test temporary directory"""
+        self.temp_dir = str(tmp_path)
+        self.configurator = configurator
 
     def test_programmatic_to_advanced_crawler_integration(self):
         """Test programmatic workflow creation to AdvancedCrawler integration"""
@@ -329,10 +332,8 @@ class TestWorkflowConfiguratorIntegration:
         config = self.configurator.configurations["file_test"]
         config_file = os.path.join(self.temp_dir, "file_test.json")
 
-        from dataclasses import asdict
-
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(asdict(config), f)
+        with open(config_file, "wb") as f:
+            f.write(orjson.dumps(config))
 
         # Clear configurations and reload
         self.configurator.configurations.clear()
@@ -426,11 +427,7 @@ class TestEndToEndWorkflow:
         assert config.pagination_config is not None
 
         # Verify selection types distribution
-        type_counts = {}
-        for selection in config.selections:
-            type_counts[selection.element_type] = (
-                type_counts.get(selection.element_type, 0) + 1
-            )
+        type_counts = Counter(s.element_type for s in config.selections)
 
         assert type_counts["items_container"] == 1
         assert type_counts["data_field"] == 6
@@ -449,9 +446,8 @@ class TestEndToEndWorkflow:
                         field in all_field_names
                     ), f"Workflow references unknown field: {field}"
 
-    def test_workflow_configurator_complete_flow(self):
+    def test_workflow_configurator_complete_flow(self, configurator):
         """Test complete flow through WorkflowConfigurator"""
-        configurator = WorkflowConfigurator()
 
         # Step 1: Create programmatic workflow
         workflow_builder = configurator.create_programmatic_workflow(
@@ -489,91 +485,80 @@ class TestEndToEndWorkflow:
 class TestConfigurationValidation:
     """Test configuration validation across components"""
 
-    def test_valid_configuration_requirements(self):
-        """Test that configurations meet minimum requirements"""
-
-        # Test valid minimal configuration
-        minimal_config = CrawlerConfiguration(
-            name="Minimal",
-            base_url="https://test.com",
-            selections=[ElementSelection("items", ".item", "items_container", "Items")],
-            workflows=[],
-        )
-
-        # Should be able to create crawler
-        crawler = AdvancedCrawler(minimal_config)
-        assert crawler._get_items_selector() is not None
-
-    def test_configuration_missing_items_container(self):
-        """Test configuration without items container"""
-
-        # Configuration with only data fields, no items container
-        no_items_config = CrawlerConfiguration(
-            name="No Items",
-            base_url="https://test.com",
-            selections=[ElementSelection("title", ".title", "data_field", "Title")],
-            workflows=[],
-        )
-
-        crawler = AdvancedCrawler(no_items_config)
-        assert crawler._get_items_selector() is None
-
-    def test_workflow_field_reference_validation(self):
-        """Test that workflow fields reference existing selections"""
-
-        selections = [
-            ElementSelection("items", ".item", "items_container", "Items"),
-            ElementSelection(
-                "existing_field", ".field", "data_field", "Existing field"
+    @pytest.mark.parametrize(
+        "selections, workflows, has_items, lookups",
+        [
+            pytest.param(
+                [ElementSelection("items", ".item", "items_container", "Items")],
+                [],
+                True,
+                {"items": True},
+                id="minimal",
             ),
-        ]
-
-        # Workflow referencing non-existent field
-        workflows = [
-            WorkflowStep(
-                "test_step",
-                "click",
-                ".link",
-                "Test",
-                extract_fields=["nonexistent_field"],
-            )
-        ]
-
+            pytest.param(
+                [ElementSelection("title", ".title", "data_field", "Title")],
+                [],
+                False,
+                {"title": True},
+                id="missing_items_container",
+            ),
+            pytest.param(
+                [
+                    ElementSelection("items", ".item", "items_container", "Items"),
+                    ElementSelection(
+                        "existing_field", ".field", "data_field", "Existing field"
+                    ),
+                ],
+                [
+                    WorkflowStep(
+                        "test_step",
+                        "click",
+                        ".link",
+                        "Test",
+                        extract_fields=["nonexistent_field"],
+                    )
+                ],
+                True,
+                {"existing_field": True, "nonexistent_field": False},
+                id="workflow_field_reference",
+            ),
+        ],
+    )
+    def test_configuration_requirements(
+        self, selections, workflows, has_items, lookups
+    ):
+        """Test crawler lookups against valid and incomplete configurations"""
         config = CrawlerConfiguration(
-            name="Invalid Refs",
+            name="Validation",
             base_url="https://test.com",
             selections=selections,
             workflows=workflows,
         )
 
+        # Should be able to create crawler
         crawler = AdvancedCrawler(config)
 
-        # Should not find the non-existent field
-        assert crawler._find_selection_by_name("existing_field") is not None
-        assert crawler._find_selection_by_name("nonexistent_field") is None
+        assert (crawler._get_items_selector() is not None) is has_items
+        for name, found in lookups.items():
+            assert (crawler._find_selection_by_name(name) is not None) is found
 
 
 class TestErrorHandlingIntegration:
     """Test error handling across integrated components"""
 
-    def test_configuration_loading_error_handling(self):
+    def test_configuration_loading_error_handling(self, tmp_path, configurator):
         """Test error handling in configuration loading"""
-        configurator = WorkflowConfigurator()
 
         # Test loading non-existent file
         config = configurator.load_configuration("nonexistent.json")
         assert config is None
 
         # Test loading file with invalid JSON
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("invalid json content {")
-            invalid_file = f.name
-
-        try:
-            config = configurator.load_configuration(invalid_file)
-            assert config is None
-        finally:
-            os.unlink(invalid_file)
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_text("invalid json content {")
+
+        config = configurator.load_configuration(str(invalid_file))
+        assert config is None
 
     @pytest.mark.asyncio
     async def test_crawler_error_handling(self):
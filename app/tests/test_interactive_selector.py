@@ -7,12 +7,100 @@ Tests the interactive element selection interface.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch, mock_open
-import json
-
+import sys
+from collections import Counter
+from unittest.mock import Mock, AsyncMock, patch
+import orjson
+
+from app.interactive.config_manager import (
+    ConfigManager,
+    format_configuration_preview,
+)
 from app.interactive.selector import InteractiveSelector
 from app.models import ElementSelection, WorkflowStep, CrawlerConfiguration
 
+_ELEMENT_TYPES = ("data_field", "items_container", "pagination", "navigation")
+_WORKFLOW_ACTIONS = ("click", "extract", "navigate_back", "open_new_tab")
+_EXTRACTION_TYPES = ("text", "href", "src", "attribute")
+_WAIT_CONDITIONS = ("networkidle", "domcontentloaded", "selector")
+
+# Configuration payloads returned by the mocked page; shared, never mutated
+_CONFIG_DATA_SUCCESS = {
+    "selections": [
+        {
+            "name": "title",
+            "selector": ".title",
+            "element_type": "data_field",
+            "description": "Title field",
+            "extraction_type": "text",
+            "attribute_name": None,
+            "workflow_action": None,
+            "original_content": None,
+            "verification_attributes": None,
+            "page_url": None,
+        }
+    ],
+    "workflows": [],
+}
+
+_CONFIG_DATA_NAVIGATION = {
+    "selections": [
+        {
+            "name": "items",
+            "selector": ".item",
+            "element_type": "items_container",
+            "description": "Items",
+            "extraction_type": "text",
+            "attribute_name": None,
+            "workflow_action": None,
+            "original_content": None,
+            "verification_attributes": None,
+            "page_url": None,
+        },
+        {
+            "name": "nav_link",
+            "selector": ".detail-link",
+            "element_type": "navigation",
+            "description": "Navigation link",
+            "extraction_type": "href",
+            "attribute_name": None,
+            "workflow_action": "click",
+            "original_content": None,
+            "verification_attributes": None,
+            "page_url": None,
+        },
+    ],
+    "workflows": [],
+}
+
+# Per-page selections the workflow generation reads back
+_PAGE_SELECTIONS = {
+    "https://test.com": [{"name": "nav_link", "element_type": "navigation"}],
+    "https://test.com/detail": [{"name": "detail_field", "element_type": "data_field"}],
+}
+
+
+@pytest.fixture(scope="class")
+def preview_config():
+    """Configuration shared by the preview tests, which only read it"""
+    return CrawlerConfiguration(
+        name="Preview Test",
+        base_url="https://test.com",
+        selections=[
+            ElementSelection("items", ".item", "items_container", "Items"),
+            ElementSelection("title", ".title", "data_field", "Title"),
+            ElementSelection("price", ".price", "data_field", "Price"),
+        ],
+        workflows=[WorkflowStep("step1", "click", ".link", "Test step", ["detail"])],
+        pagination_config=ElementSelection("next", ".next", "pagination", "Next page"),
+    )
+
+
+@pytest.fixture
+def selector():
+    """Fresh headless InteractiveSelector; tests attach their own mock page"""
+    return InteractiveSelector(headless=True)
+
 
 class TestElementSelection:
     """Test ElementSelection dataclass"""
@@ -58,18 +146,31 @@ class TestElementSelection:
         assert selection.verification_attributes == verification_attrs
         assert selection.page_url == "https://test.com/page1"
 
-    def test_element_selection_types(self):
+    @pytest.mark.parametrize("element_type", _ELEMENT_TYPES)
+    def test_element_selection_types(self, element_type):
         """Test different element types are handled correctly"""
-        types = ["data_field", "items_container", "pagination", "navigation"]
+        selection = ElementSelection(
+            name=f"test_{element_type}",
+            selector=f".{element_type}",
+            element_type=element_type,
+            description=f"Test {element_type}",
+        )
+        assert selection.element_type == element_type
 
-        for element_type in types:
-            selection = ElementSelection(
-                name=f"test_{element_type}",
-                selector=f".{element_type}",
-                element_type=element_type,
-                description=f"Test {element_type}",
-            )
-            assert selection.element_type == element_type
+    def test_element_selection_strings_interned(self):
+        """Test that selection names and selectors are interned on creation"""
+        name, selector = "".join(["ti", "tle"]), "".join([".ti", "tle"])
+        selection = ElementSelection(name, selector, "data_field", "Title")
+
+        assert selection.name is sys.intern("title")
+        assert selection.selector is sys.intern(".title")
+
+    def test_element_selection_accepts_null_name(self):
+        """Test that a loaded config with a null name still builds"""
+        selection = ElementSelection(None, ".title", "data_field", "Title")
+
+        assert selection.name is None
+        assert selection.selector == ".title"
 
 
 class TestWorkflowStep:
@@ -110,18 +211,16 @@ class TestWorkflowStep:
         assert step.wait_condition == "selector"
         assert step.wait_selector == ".loaded-content"
 
-    def test_workflow_step_actions(self):
+    @pytest.mark.parametrize("action", _WORKFLOW_ACTIONS)
+    def test_workflow_step_actions(self, action):
         """Test different workflow actions"""
-        actions = ["click", "extract", "navigate_back", "open_new_tab"]
-
-        for action in actions:
-            step = WorkflowStep(
-                step_id=f"test_{action}",
-                action=action,
-                target_selector=f".{action}",
-                description=f"Test {action}",
-            )
-            assert step.action == action
+        step = WorkflowStep(
+            step_id=f"test_{action}",
+            action=action,
+            target_selector=f".{action}",
+            description=f"Test {action}",
+        )
+        assert step.action == action
 
 
 class TestCrawlerConfiguration:
@@ -174,91 +273,59 @@ class TestCrawlerConfiguration:
         assert config.delay_ms == 2000
 
 
-@pytest.mark.asyncio
 class TestInteractiveSelector:
     """Test InteractiveSelector functionality"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.selector = InteractiveSelector(headless=True)
-
     def test_interactive_selector_initialization(self):
         """Test InteractiveSelector initialization"""
         selector = InteractiveSelector(headless=False)
 
         assert selector.headless is False
-        assert selector.browser is None
-        assert selector.page is None
+        # The browser and the helpers bound to its page are created on entry
+        assert selector.browser_manager is None
+        assert selector.ui_injector is None
+        assert selector.config_manager is None
         assert selector.selections == []
         assert selector.workflows == []
         assert selector.current_mode == "selection"
 
-    @patch("app.interactive.selector.async_playwright")
-    async def test_context_manager_setup(self, mock_playwright):
+    @pytest.mark.browser
+    @patch("app.interactive.browser_manager.async_playwright")
+    async def test_context_manager_setup(self, mock_async_playwright, mock_playwright):
         """Test async context manager setup for InteractiveSelector"""
-        mock_playwright_instance = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_page = AsyncMock()
-
-        mock_playwright.return_value.start = AsyncMock(
-            return_value=mock_playwright_instance
+        mock_browser = mock_playwright["browser"]
+        mock_context = mock_playwright["context"]
+        mock_page = mock_playwright["page"]
+        mock_async_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright["playwright_instance"]
         )
-        mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_context.new_page = AsyncMock(return_value=mock_page)
 
         selector = InteractiveSelector(headless=True)
 
         async with selector:
-            assert selector.browser == mock_browser
-            assert selector.context == mock_context
-            assert selector.page == mock_page
+            assert selector.browser_manager.browser == mock_browser
+            assert selector.browser_manager.context == mock_context
+            assert selector.browser_manager.get_page() == mock_page
+            assert selector.config_manager is not None
 
         # Verify cleanup
         mock_context.close.assert_called_once()
         mock_browser.close.assert_called_once()
 
-    async def test_get_configuration_no_data(self):
+    async def test_get_configuration_no_data(self, selector, mock_playwright):
         """Test get_configuration when no selections were made"""
-        selector = InteractiveSelector()
-
-        # Mock page with no configuration data
-        mock_page = AsyncMock()
-        mock_page.evaluate = AsyncMock(return_value=None)
-        mock_page.url = "https://test.com"
-        selector.page = mock_page
+        # conftest's mock page evaluates to no configuration data by default
+        selector.config_manager = ConfigManager(mock_playwright["page"])
 
         config = await selector.get_configuration()
         assert config is None
 
-    async def test_get_configuration_success(self):
+    async def test_get_configuration_success(self, selector, mock_playwright):
         """Test successful get_configuration"""
-        selector = InteractiveSelector()
-
         # Mock page with configuration data
-        mock_page = AsyncMock()
-        config_data = {
-            "selections": [
-                {
-                    "name": "title",
-                    "selector": ".title",
-                    "element_type": "data_field",
-                    "description": "Title field",
-                    "extraction_type": "text",
-                    "attribute_name": None,
-                    "workflow_action": None,
-                    "original_content": None,
-                    "verification_attributes": None,
-                    "page_url": None,
-                }
-            ],
-            "workflows": [],
-        }
-
-        mock_page.evaluate = AsyncMock(return_value=config_data)
-        mock_page.url = "https://test.com"
-        selector.page = mock_page
+        mock_page = mock_playwright["page"]
+        mock_page.evaluate.return_value = _CONFIG_DATA_SUCCESS
+        selector.config_manager = ConfigManager(mock_page)
 
         config = await selector.get_configuration()
 
@@ -268,55 +335,20 @@ class TestInteractiveSelector:
         assert len(config.selections) == 1
         assert config.selections[0].name == "title"
 
-    async def test_get_configuration_with_navigation_workflow_generation(self):
+    async def test_get_configuration_with_navigation_workflow_generation(
+        self, selector, mock_playwright
+    ):
         """Test workflow generation from navigation selections"""
-        selector = InteractiveSelector()
-
         # Mock page with navigation selections
-        mock_page = AsyncMock()
-        config_data = {
-            "selections": [
-                {
-                    "name": "items",
-                    "selector": ".item",
-                    "element_type": "items_container",
-                    "description": "Items",
-                    "extraction_type": "text",
-                    "attribute_name": None,
-                    "workflow_action": None,
-                    "original_content": None,
-                    "verification_attributes": None,
-                    "page_url": None,
-                },
-                {
-                    "name": "nav_link",
-                    "selector": ".detail-link",
-                    "element_type": "navigation",
-                    "description": "Navigation link",
-                    "extraction_type": "href",
-                    "attribute_name": None,
-                    "workflow_action": "click",
-                    "original_content": None,
-                    "verification_attributes": None,
-                    "page_url": None,
-                },
-            ],
-            "workflows": [],
-        }
+        results = iter([_CONFIG_DATA_NAVIGATION, _PAGE_SELECTIONS, "https://test.com"])
 
-        # Mock page selections data for workflow generation
-        page_selections = {
-            "https://test.com": [{"name": "nav_link", "element_type": "navigation"}],
-            "https://test.com/detail": [
-                {"name": "detail_field", "element_type": "data_field"}
-            ],
-        }
+        async def evaluate(*args, **kwargs):
+            # Each evaluate call gets the next canned result, in order
+            return next(results)
 
-        mock_page.evaluate = AsyncMock(
-            side_effect=[config_data, page_selections, "https://test.com"]
-        )
-        mock_page.url = "https://test.com"
-        selector.page = mock_page
+        mock_page = mock_playwright["page"]
+        mock_page.evaluate = evaluate
+        selector.config_manager = ConfigManager(mock_page)
 
         config = await selector.get_configuration()
 
@@ -325,9 +357,7 @@ class TestInteractiveSelector:
         assert config.workflows[0].step_id == "nav_nav_link"
         assert config.workflows[0].action == "click"
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
-    async def test_save_configuration(self, mock_json_dump, mock_file):
+    async def test_save_configuration(self, selector, mock_playwright, tmp_path):
         """Test saving configuration to file"""
         selections = [ElementSelection("title", ".title", "data_field", "Title")]
 
@@ -337,59 +367,47 @@ class TestInteractiveSelector:
             selections=selections,
             workflows=[],
         )
+        config_file = tmp_path / "test_config.json"
 
-        selector = InteractiveSelector()
-        await selector.save_configuration(config, "test_config.json")
+        # The config manager is normally created once the browser has started
+        selector.config_manager = ConfigManager(mock_playwright["page"])
+        await selector.save_configuration(config, str(config_file))
 
-        mock_file.assert_called_once_with("test_config.json", "w", encoding="utf-8")
-        mock_json_dump.assert_called_once()
+        saved = orjson.loads(config_file.read_bytes())
+        assert saved["name"] == "Test Config"
+        assert saved["base_url"] == "https://test.com"
+        assert saved["selections"][0]["selector"] == ".title"
+        assert saved["workflows"] == []
 
-    def test_preview_configuration(self, capsys):
+    def test_preview_configuration(self, preview_config):
         """Test preview_configuration output"""
-        selections = [
-            ElementSelection("items", ".item", "items_container", "Items"),
-            ElementSelection("title", ".title", "data_field", "Title"),
-            ElementSelection("price", ".price", "data_field", "Price"),
-        ]
+        preview = format_configuration_preview(preview_config)
 
-        workflows = [WorkflowStep("step1", "click", ".link", "Test step", ["detail"])]
+        assert "Preview Test" in preview
+        assert "https://test.com" in preview
+        assert "3 total" in preview  # 3 selections
+        assert "1 steps" in preview  # 1 workflow step
+        assert ".next" in preview  # Pagination selector
 
-        pagination_config = ElementSelection("next", ".next", "pagination", "Next page")
+    def test_selector_prints_preview(self, selector, preview_config, capsys):
+        """Test that the selector prints the formatted preview without a browser"""
+        selector.preview_configuration(preview_config)
 
-        config = CrawlerConfiguration(
-            name="Preview Test",
-            base_url="https://test.com",
-            selections=selections,
-            workflows=workflows,
-            pagination_config=pagination_config,
-        )
-
-        selector = InteractiveSelector()
-        selector.preview_configuration(config)
-
-        captured = capsys.readouterr()
-        assert "Preview Test" in captured.out
-        assert "https://test.com" in captured.out
-        assert "3 total" in captured.out  # 3 selections
-        assert "1 steps" in captured.out  # 1 workflow step
-        assert ".next" in captured.out  # Pagination selector
+        expected = format_configuration_preview(preview_config)
+        assert capsys.readouterr().out == expected + "\n"
 
 
 class TestInteractiveSelectorMethods:
     """Test InteractiveSelector helper methods without browser setup"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.selector = InteractiveSelector(headless=True)
-
     @patch("asyncio.get_event_loop")
-    async def test_wait_for_user_completion(self, mock_get_loop):
+    async def test_wait_for_user_completion(self, mock_get_loop, selector):
         """Test _wait_for_user_completion method"""
         mock_loop = Mock()
         mock_get_loop.return_value = mock_loop
         mock_loop.run_in_executor = AsyncMock(return_value=True)
 
-        await self.selector._wait_for_user_completion()
+        await selector._wait_for_user_completion()
 
         mock_loop.run_in_executor.assert_called_once()
         # Verify the executor was called with None and a callable
@@ -398,132 +416,125 @@ class TestInteractiveSelectorMethods:
         assert callable(args[1])
 
 
+@pytest.mark.browser
 class TestInteractiveSelectorIntegration:
     """Integration tests for InteractiveSelector with mocked browser"""
 
-    @pytest.mark.asyncio
-    @patch("app.interactive.selector.async_playwright")
-    async def test_start_selection_session_setup(self, mock_playwright):
+    @patch("asyncio.sleep", new_callable=AsyncMock)
+    @patch("app.interactive.browser_manager.async_playwright")
+    async def test_start_selection_session_setup(
+        self, mock_async_playwright, mock_sleep, mock_playwright
+    ):
         """Test start_selection_session setup process"""
-        mock_playwright_instance = AsyncMock()
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_page = AsyncMock()
-
-        mock_playwright.return_value.start = AsyncMock(
-            return_value=mock_playwright_instance
+        mock_page = mock_playwright["page"]
+        mock_async_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright["playwright_instance"]
         )
-        mock_playwright_instance.firefox.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_context.new_page = AsyncMock(return_value=mock_page)
 
         selector = InteractiveSelector(headless=True)
-
-        # Mock the UI injection and user completion methods
-        selector._inject_ui_after_load = AsyncMock()
-        selector._setup_navigation_detection = AsyncMock()
         selector._wait_for_user_completion = AsyncMock()
 
         async with selector:
+            # The UI injector only exists once the browser has started
+            selector.ui_injector.inject_modern_ui = AsyncMock()
+            selector.ui_injector.setup_navigation_detection = AsyncMock()
             await selector.start_selection_session("https://test.com")
 
+            # Verify UI setup
+            selector.ui_injector.inject_modern_ui.assert_called_once()
+            selector.ui_injector.setup_navigation_detection.assert_called_once()
+
         # Verify page navigation
         mock_page.goto.assert_called_once_with("https://test.com")
         mock_page.wait_for_load_state.assert_called_with("networkidle")
-
-        # Verify UI setup
-        selector._inject_ui_after_load.assert_called_once()
-        selector._setup_navigation_detection.assert_called_once()
         selector._wait_for_user_completion.assert_called_once()
 
 
 class TestConfigurationDataValidation:
     """Test configuration data validation and transformation"""
 
-    def test_valid_element_types(self):
-        """Test that only valid element types are accepted"""
-        valid_types = ["data_field", "items_container", "pagination", "navigation"]
-
-        for element_type in valid_types:
-            selection = ElementSelection(
-                name="test",
-                selector=".test",
-                element_type=element_type,
-                description="Test",
-            )
-            assert selection.element_type == element_type
-
-    def test_valid_extraction_types(self):
+    @pytest.mark.parametrize("extraction_type", _EXTRACTION_TYPES)
+    def test_valid_extraction_types(self, extraction_type):
         """Test different extraction types"""
-        extraction_types = ["text", "href", "src", "attribute"]
-
-        for extraction_type in extraction_types:
-            selection = ElementSelection(
-                name="test",
-                selector=".test",
-                element_type="data_field",
-                description="Test",
-                extraction_type=extraction_type,
-            )
-            assert selection.extraction_type == extraction_type
-
-    def test_valid_workflow_actions(self):
-        """Test different workflow actions"""
-        actions = ["click", "extract", "navigate_back", "open_new_tab"]
-
-        for action in actions:
-            step = WorkflowStep(
-                step_id="test",
-                action=action,
-                target_selector=".test",
-                description="Test",
-            )
-            assert step.action == action
-
-    def test_wait_conditions(self):
-        """Test different wait conditions"""
-        wait_conditions = ["networkidle", "domcontentloaded", "selector"]
+        selection = ElementSelection(
+            name="test",
+            selector=".test",
+            element_type="data_field",
+            description="Test",
+            extraction_type=extraction_type,
+        )
+        assert selection.extraction_type == extraction_type
 
-        for condition in wait_conditions:
-            step = WorkflowStep(
-                step_id="test",
-                action="click",
-                target_selector=".test",
-                description="Test",
-                wait_condition=condition,
-            )
-            assert step.wait_condition == condition
+    @pytest.mark.parametrize("condition", _WAIT_CONDITIONS)
+    def test_wait_conditions(self, condition):
+        """Test different wait conditions"""
+        step = WorkflowStep(
+            step_id="test",
+            action="click",
+            target_selector=".test",
+            description="Test",
+            wait_condition=condition,
+        )
+        assert step.wait_condition == condition
 
 
 class TestConfigurationComplexity:
     """Test complex configuration scenarios"""
 
-    def test_multi_step_workflow_configuration(self):
-        """Test configuration with multiple workflow steps"""
-        selections = [
-            ElementSelection("items", ".product", "items_container", "Products"),
-            ElementSelection("title", ".title", "data_field", "Title"),
-            ElementSelection("detail", ".detail", "data_field", "Detail"),
-            ElementSelection("review", ".review", "data_field", "Review"),
-        ]
-
-        workflows = [
-            WorkflowStep(
-                "get_details",
-                "click",
-                ".detail-link",
-                "Get product details",
-                ["detail"],
+    @pytest.mark.parametrize(
+        "selections, workflows, type_counts, steps",
+        [
+            pytest.param(
+                [
+                    ElementSelection(
+                        "items", ".product", "items_container", "Products"
+                    ),
+                    ElementSelection("title", ".title", "data_field", "Title"),
+                    ElementSelection("detail", ".detail", "data_field", "Detail"),
+                    ElementSelection("review", ".review", "data_field", "Review"),
+                ],
+                [
+                    WorkflowStep(
+                        "get_details",
+                        "click",
+                        ".detail-link",
+                        "Get product details",
+                        ["detail"],
+                    ),
+                    WorkflowStep(
+                        "get_reviews",
+                        "open_new_tab",
+                        ".review-link",
+                        "Get reviews in new tab",
+                        ["review"],
+                    ),
+                ],
+                {"items_container": 1, "data_field": 3},
+                [("click", ["detail"]), ("open_new_tab", ["review"])],
+                id="multi_step_workflow",
             ),
-            WorkflowStep(
-                "get_reviews",
-                "open_new_tab",
-                ".review-link",
-                "Get reviews in new tab",
-                ["review"],
+            pytest.param(
+                [
+                    ElementSelection(
+                        "items", ".item", "items_container", "Items container"
+                    ),
+                    ElementSelection("title", ".title", "data_field", "Data field"),
+                    ElementSelection(
+                        "next", ".next", "pagination", "Pagination element"
+                    ),
+                    ElementSelection(
+                        "link", ".link", "navigation", "Navigation element"
+                    ),
+                ],
+                [],
+                dict.fromkeys(_ELEMENT_TYPES, 1),
+                [],
+                id="all_element_types",
             ),
-        ]
-
+        ],
+    )
+    def test_configuration_structure(self, selections, workflows, type_counts, steps):
+        """Test selection types and workflow steps of complex configurations"""
         config = CrawlerConfiguration(
             name="Complex Config",
             base_url="https://shop.com",
@@ -531,43 +542,5 @@ class TestConfigurationComplexity:
             workflows=workflows,
         )
 
-        # Verify configuration structure
-        assert len(config.selections) == 4
-        assert len(config.workflows) == 2
-
-        # Verify workflow relationships
-        detail_workflow = config.workflows[0]
-        review_workflow = config.workflows[1]
-
-        assert detail_workflow.action == "click"
-        assert review_workflow.action == "open_new_tab"
-        assert "detail" in detail_workflow.extract_fields
-        assert "review" in review_workflow.extract_fields
-
-    def test_configuration_with_all_element_types(self):
-        """Test configuration containing all element types"""
-        selections = [
-            ElementSelection("items", ".item", "items_container", "Items container"),
-            ElementSelection("title", ".title", "data_field", "Data field"),
-            ElementSelection("next", ".next", "pagination", "Pagination element"),
-            ElementSelection("link", ".link", "navigation", "Navigation element"),
-        ]
-
-        config = CrawlerConfiguration(
-            name="All Types",
-            base_url="https://test.com",
-            selections=selections,
-            workflows=[],
-        )
-
-        # Count selections by type
-        type_counts = {}
-        for selection in config.selections:
-            type_counts[selection.element_type] = (
-                type_counts.get(selection.element_type, 0) + 1
-            )
-
-        assert type_counts["items_container"] == 1
-        assert type_counts["data_field"] == 1
-        assert type_counts["pagination"] == 1
-        assert type_counts["navigation"] == 1
+        assert Counter(s.element_type for s in config.selections) == type_counts
+        assert [(w.action, w.extract_fields) for w in config.workflows] == steps
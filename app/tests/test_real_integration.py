@@ -19,6 +19,9 @@ from app.advanced.advanced_crawler import AdvancedCrawler, ExtractionResult
 from app.advanced.workflow_builder import WorkflowBuilder
 from app.models import CrawlerConfiguration, ElementSelection, WorkflowStep
 
+# Every test here launches a real browser; deselect with -m "not browser"
+pytestmark = pytest.mark.browser
+
 
 class TestLocalHTMLIntegration:
     """Test crawler against local HTML files"""
@@ -29,7 +32,7 @@ class TestLocalHTMLIntegration:
         return f"file://{test_dir.absolute()}/{filename}"
 
     @pytest.mark.asyncio
-    async def test_basic_extraction_from_local_html(self):
+    async def test_basic_extraction_from_local_html(self, browser_pool):
         """Test basic data extraction from local HTML file"""
 
         config = CrawlerConfiguration(
@@ -56,7 +59,7 @@ class TestLocalHTMLIntegration:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Verify we extracted the expected products
@@ -82,7 +85,7 @@ class TestLocalHTMLIntegration:
             assert result.source_url.endswith("products_page.html")
 
     @pytest.mark.asyncio
-    async def test_pagination_with_local_html(self):
+    async def test_pagination_with_local_html(self, browser_pool):
         """Test pagination functionality with local HTML files"""
 
         config = CrawlerConfiguration(
@@ -100,7 +103,7 @@ class TestLocalHTMLIntegration:
             max_pages=2,  # Test pagination to second page
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should have products from both pages
@@ -126,7 +129,7 @@ class TestLocalHTMLIntegration:
             ), f"Missing product: {expected_title}"
 
     @pytest.mark.asyncio
-    async def test_click_workflow_with_local_html(self):
+    async def test_click_workflow_with_local_html(self, browser_pool):
         """Test click workflow functionality with local HTML files"""
 
         # Create workflow that clicks detail links to extract more information
@@ -158,7 +161,7 @@ class TestLocalHTMLIntegration:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should have products with workflow data
@@ -177,7 +180,7 @@ class TestLocalHTMLIntegration:
             assert "★★★★☆" in first_result["rating"]
 
     @pytest.mark.asyncio
-    async def test_error_handling_missing_elements(self):
+    async def test_error_handling_missing_elements(self, browser_pool):
         """Test crawler behavior when configured elements don't exist"""
 
         config = CrawlerConfiguration(
@@ -197,7 +200,7 @@ class TestLocalHTMLIntegration:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should still extract available data, set missing fields to None
@@ -219,7 +222,7 @@ class TestLocalHTMLIntegration:
 class TestRealWebsiteIntegration:
     """Test crawler against real websites (marked as slow tests)"""
 
-    async def test_quotes_toscrape_basic_extraction(self):
+    async def test_quotes_toscrape_basic_extraction(self, browser_pool):
         """Test extraction from quotes.toscrape.com - a reliable test site"""
 
         config = CrawlerConfiguration(
@@ -235,7 +238,7 @@ class TestRealWebsiteIntegration:
             max_pages=1,  # Just test one page to keep test fast
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # quotes.toscrape.com has 10 quotes per page
@@ -265,7 +268,7 @@ class TestRealWebsiteIntegration:
             "Einstein" in author for author in extracted_authors
         ), "Should have Einstein quotes"
 
-    async def test_quotes_toscrape_pagination(self):
+    async def test_quotes_toscrape_pagination(self, browser_pool):
         """Test pagination functionality on quotes.toscrape.com"""
 
         config = CrawlerConfiguration(
@@ -283,7 +286,7 @@ class TestRealWebsiteIntegration:
             max_pages=3,  # Test multiple pages
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should have quotes from multiple pages (quotes.toscrape.com has 10 per page)
@@ -302,7 +305,7 @@ class TestRealWebsiteIntegration:
             len(unique_texts) >= len(results) * 0.8
         ), "Too many duplicate quotes - pagination may not be working"
 
-    async def test_httpbin_different_content_types(self):
+    async def test_httpbin_different_content_types(self, browser_pool):
         """Test extraction from httpbin.org for different content scenarios"""
 
         # Test JSON endpoint extraction
@@ -317,7 +320,7 @@ class TestRealWebsiteIntegration:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should extract the JSON content
@@ -400,7 +403,7 @@ class TestAdvancedWorkflowsRealBrowser:
                 assert data["detailed_title"] == "Bluetooth Speaker Pro"
                 assert "★★★★★" in data["rating"]
 
-    async def test_element_visibility_and_clickability(self):
+    async def test_element_visibility_and_clickability(self, browser_pool):
         """Test that crawler properly detects clickable vs non-clickable elements"""
 
         # Create HTML with both clickable and non-clickable elements
@@ -426,7 +429,7 @@ class TestAdvancedWorkflowsRealBrowser:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should successfully extract data - if elements weren't clickable,
@@ -445,7 +448,7 @@ class TestAdvancedWorkflowsRealBrowser:
         ]
         # Note: The workflow adds fields but they might not all extract successfully due to navigation complexity
 
-    async def test_error_recovery_real_browser(self):
+    async def test_error_recovery_real_browser(self, browser_pool):
         """Test error recovery when workflows encounter problems"""
 
         # Create workflow that tries to click non-existent elements
@@ -470,7 +473,7 @@ class TestAdvancedWorkflowsRealBrowser:
             max_pages=1,
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         # Should still extract basic data even when workflow fails
@@ -536,7 +539,7 @@ class TestRealWorldScenarios:
             len(results_with_bio) >= 1
         ), "At least one quote should have author bio extracted"
 
-    async def test_performance_with_real_browser(self):
+    async def test_performance_with_real_browser(self, browser_pool):
         """Test crawler performance and resource usage with real browser"""
 
         config = CrawlerConfiguration(
@@ -559,7 +562,7 @@ class TestRealWorldScenarios:
 
         start_time = time.time()
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             results = await crawler.crawl_with_workflows()
 
         end_time = time.time()
@@ -589,7 +592,7 @@ class TestBrowserCompatibilityReal:
         test_dir = Path(__file__).parent / "test_html"
         return f"file://{test_dir.absolute()}/{filename}"
 
-    async def test_firefox_specific_features(self):
+    async def test_firefox_specific_features(self, browser_pool):
         """Test crawler works correctly with Firefox-specific behavior"""
 
         config = CrawlerConfiguration(
@@ -605,7 +608,7 @@ class TestBrowserCompatibilityReal:
         )
 
         # Test with Firefox (which is what the crawler uses)
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             # Verify Firefox-specific settings are applied
             assert crawler.headless is True
 
@@ -619,7 +622,7 @@ class TestBrowserCompatibilityReal:
             assert crawler.context is not None
             assert crawler.main_page is not None
 
-    async def test_network_and_timing_real(self):
+    async def test_network_and_timing_real(self, browser_pool):
         """Test real network timing and load conditions"""
 
         config = CrawlerConfiguration(
@@ -634,7 +637,7 @@ class TestBrowserCompatibilityReal:
             delay_ms=200,  # Test with real delays
         )
 
-        async with AdvancedCrawler(config, headless=True) as crawler:
+        async with AdvancedCrawler(config, pool=browser_pool) as crawler:
             # Test that networkidle waiting works correctly
             await crawler.main_page.goto(config.base_url)
             await crawler.main_page.wait_for_load_state("networkidle")
@@ -5,10 +5,15 @@ Test Runner for Interactive Web Crawler System
 Provides utilities for running specific test suites and generating reports.
 """
 
+import importlib.util
+import os
 import sys
 import subprocess
 from pathlib import Path
 
+# Test runs are throwaway processes; skip writing .pyc files for every import
+_PYTEST_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
 
 def run_all_tests():
     """Run all tests with coverage reporting"""
@@ -25,9 +30,13 @@ def run_all_tests():
                 "-v",
                 "--tb=short",
                 "--color=yes",
+                # Run last run's failures, then new test files, before the rest
+                "--ff",
+                "--nf",
             ],
             capture_output=False,
             check=False,
+            env=_PYTEST_ENV,
         )
 
         if result.returncode == 0:
@@ -42,8 +51,43 @@ def run_all_tests():
         return 1
 
 
-def run_specific_test_file(test_file: str):
-    """Run tests from a specific file"""
+def run_parallel_tests():
+    """Run all tests spread across CPU cores with pytest-xdist"""
+    print("🚀 Running all crawler system tests in parallel...")
+    print("=" * 50)
+
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "app/tests/",
+                "-n",
+                "auto",
+                # Keep each test class on one worker so class-scoped fixtures
+                # are built once
+                "--dist",
+                "loadscope",
+                "--tb=short",
+                "--color=yes",
+                "--ff",
+                "--nf",
+            ],
+            capture_output=False,
+            check=False,
+            env=_PYTEST_ENV,
+        )
+
+        return result.returncode
+
+    except FileNotFoundError:
+        print("❌ pytest not found. Install with: uv add pytest")
+        return 1
+
+
+def run_specific_test_file(test_file: str, parallel: bool = False):
+    """Run tests from a specific file, optionally spread across CPU cores"""
     print(f"🧪 Running tests from {test_file}...")
     print("=" * 50)
 
@@ -62,9 +106,15 @@ def run_specific_test_file(test_file: str):
                 "-v",
                 "--tb=short",
                 "--color=yes",
-            ],
+                # Partial runs would only overwrite the full suite's cache
+                "-p",
+                "no:cacheprovider",
+            ]
+            # Hand out individual tests so parametrized cases spread evenly
+            + (["-n", "auto", "--dist", "load"] if parallel else []),
             capture_output=False,
             check=False,
+            env=_PYTEST_ENV,
         )
 
         return result.returncode
@@ -77,7 +127,7 @@ def run_specific_test_file(test_file: str):
 def run_tests_by_category():
     """Run tests organized by functionality category"""
     categories = {
-        "Core": ["test_config.py", "test_crawler.py"],
+        "Core": ["test_config.py", "test_crawler.py", "test_browser_pool.py"],
         "Advanced": ["test_advanced_crawler.py"],
         "Interactive": [
             "test_interactive_selector.py",
@@ -129,9 +179,44 @@ def run_quick_tests():
         result = subprocess.run(
             [sys.executable, "-m", "pytest"]
             + quick_tests
-            + ["-v", "--tb=line", "--color=yes"],
+            + ["-v", "--tb=line", "--color=yes", "-p", "no:cacheprovider"],
             capture_output=False,
             check=False,
+            env=_PYTEST_ENV,
+        )
+
+        return result.returncode
+
+    except FileNotFoundError:
+        print("❌ pytest not found. Install with: uv add pytest")
+        return 1
+
+
+def run_timing_tests():
+    """Run the fast unit suites and report the slowest tests"""
+    print("⏱️  Running timing-guarded test suite...")
+    print("=" * 50)
+
+    if importlib.util.find_spec("pytest_fail_slow") is None:
+        print("❌ pytest-fail-slow not found. Install with: uv sync")
+        return 1
+
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pytest",
+                "app/tests/test_advanced_crawler.py",
+                "app/tests/test_config.py",
+                "--durations=10",
+                "--durations-min=0.05",
+                "--tb=short",
+                "--color=yes",
+            ],
+            capture_output=False,
+            check=False,
+            env=_PYTEST_ENV,
         )
 
         return result.returncode
@@ -160,6 +245,7 @@ def check_test_coverage():
             ],
             capture_output=False,
             check=False,
+            env=_PYTEST_ENV,
         )
 
         if result.returncode == 0:
@@ -181,26 +267,35 @@ def main():
     )
     parser.add_argument(
         "command",
-        choices=["all", "quick", "category", "coverage", "file"],
+        choices=["all", "parallel", "quick", "category", "coverage", "timing", "file"],
         help="Type of test run to execute",
     )
     parser.add_argument("--file", help="Specific test file to run (for 'file' command)")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the file across CPU cores with pytest-xdist (for 'file' command)",
+    )
 
     args = parser.parse_args()
 
     if args.command == "all":
         return run_all_tests()
+    elif args.command == "parallel":
+        return run_parallel_tests()
     elif args.command == "quick":
         return run_quick_tests()
     elif args.command == "category":
         return run_tests_by_category()
     elif args.command == "coverage":
         return check_test_coverage()
+    elif args.command == "timing":
+        return run_timing_tests()
     elif args.command == "file":
         if not args.file:
             print("❌ --file argument required for 'file' command")
             return 1
-        return run_specific_test_file(args.file)
+        return run_specific_test_file(args.file, parallel=args.parallel)
 
 
 if __name__ == "__main__":
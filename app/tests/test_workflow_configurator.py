@@ -8,7 +8,7 @@ Tests the workflow configuration and management system.
 import pytest
 import asyncio
 import os
-import json
+from dataclasses import replace
 from unittest.mock import Mock, AsyncMock, patch, mock_open
 
 from app.interactive.configurator import WorkflowConfigurator
@@ -30,6 +30,14 @@ class TestWorkflowConfigurator:
         assert configurator.configurations == {}
         assert configurator.config_directory == "crawler_configs"
 
+    @patch("os.makedirs")
+    def test_supplied_config_directory_is_used_as_is(self, mock_makedirs):
+        """Test that a caller-supplied config directory is not created"""
+        configurator = WorkflowConfigurator(config_directory="custom_configs")
+
+        assert configurator.config_directory == "custom_configs"
+        mock_makedirs.assert_not_called()
+
     @patch("os.path.exists", return_value=False)
     @patch("os.makedirs")
     def test_ensure_config_directory_creates_directory(
@@ -133,8 +141,8 @@ class TestWorkflowConfigurator:
         assert "nonexistent" not in configurator.configurations
 
     @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
-    def test_load_configuration_success(self, mock_json_load, mock_file):
+    @patch("orjson.loads")
+    def test_load_configuration_success(self, mock_loads, mock_file):
         """Test successful configuration loading"""
         config_data = {
             "name": "Loaded Config",
@@ -180,7 +188,7 @@ class TestWorkflowConfigurator:
             "delay_ms": 2000,
         }
 
-        mock_json_load.return_value = config_data
+        mock_loads.return_value = config_data
 
         configurator = WorkflowConfigurator()
         config = configurator.load_configuration("test_config.json")
@@ -207,9 +215,8 @@ class TestWorkflowConfigurator:
         assert config is None
         assert "nonexistent" not in configurator.configurations
 
-    @patch("builtins.open")
-    @patch("json.load", side_effect=json.JSONDecodeError("Invalid JSON", "doc", 0))
-    def test_load_configuration_invalid_json(self, mock_json_load, mock_file):
+    @patch("builtins.open", new_callable=mock_open, read_data=b"{not json")
+    def test_load_configuration_invalid_json(self, mock_file):
         """Test loading configuration with invalid JSON"""
         configurator = WorkflowConfigurator()
 
@@ -334,11 +341,11 @@ class TestWorkflowConfiguratorIntegration:
         # Test the method
         result = await self.configurator.test_configuration("test_config", max_pages=1)
 
-        # Verify configuration was modified with max_pages
-        assert config.max_pages == 1
-
-        # Verify crawler was instantiated correctly
-        mock_crawler_class.assert_called_once_with(config, headless=False)
+        # Verify crawler was instantiated with a max_pages-limited copy
+        mock_crawler_class.assert_called_once_with(
+            replace(config, max_pages=1), headless=False
+        )
+        assert config.max_pages is None
 
         # Verify async context manager was used
         mock_crawler_instance.__aenter__.assert_called_once()
@@ -606,13 +613,13 @@ class TestConfigurationFileManagement:
 
     @patch("os.path.join")
     @patch("builtins.open", new_callable=mock_open)
-    @patch("json.load")
+    @patch("orjson.loads")
     def test_load_configuration_file_path_handling(
-        self, mock_json_load, mock_file, mock_path_join
+        self, mock_loads, mock_file, mock_path_join
     ):
         """Test proper file path handling in load_configuration"""
         mock_path_join.return_value = "crawler_configs/test.json"
-        mock_json_load.return_value = {
+        mock_loads.return_value = {
             "name": "Test",
             "base_url": "https://test.com",
             "selections": [],
@@ -6,7 +6,8 @@ Simple script to load and run your saved visual crawler configuration
 """
 
 import asyncio
-import json
+import orjson
+from dataclasses import replace
 from app.interactive.configurator import WorkflowConfigurator
 
 
@@ -34,11 +35,13 @@ async def run_saved_config():
 
         # Clean up the selectors (remove .crawler-highlight artifacts)
         print("🧹 Cleaning up selectors...")
-        for selection in config.selections:
+        for i, selection in enumerate(config.selections):
             if ".crawler-highlight" in selection.selector:
-                selection.selector = selection.selector.replace(
-                    ".crawler-highlight", ""
+                selection = replace(
+                    selection,
+                    selector=selection.selector.replace(".crawler-highlight", ""),
                 )
+                config.selections[i] = selection
                 print(f"  Cleaned: {selection.name} -> {selection.selector}")
 
         # Show configuration preview
@@ -67,7 +70,7 @@ async def run_saved_config():
         elif choice == "2":
             pages = input("📄 How many pages to crawl? (Enter for all): ").strip()
             if pages.isdigit():
-                config.max_pages = int(pages)
+                config = replace(config, max_pages=int(pages))
 
             output_file = input("💾 Output filename (Enter for default): ").strip()
             output_file = output_file or f"{config_name}_results.json"
@@ -97,7 +100,7 @@ async def edit_configuration_interactive(config):
 
         new_name = input(f"  New name (Enter to keep '{selection.name}'): ").strip()
         if new_name:
-            selection.name = new_name
+            selection = replace(selection, name=new_name)
 
         # Fix element type if needed
         if selection.element_type not in [
@@ -112,7 +115,9 @@ async def edit_configuration_interactive(config):
 
             new_type = input(f"  New type: ").strip()
             if new_type in ["data_field", "items_container", "pagination"]:
-                selection.element_type = new_type
+                selection = replace(selection, element_type=new_type)
+
+        config.selections[i] = selection
 
     # Add missing items container if needed
     has_items = any(s.element_type == "items_container" for s in config.selections)
@@ -135,13 +140,8 @@ async def edit_configuration_interactive(config):
     # Save updated configuration
     config_file = f"crawler_configs/{config.name}.json"
 
-    # Convert to dict for saving
-    from dataclasses import asdict
-
-    config_dict = asdict(config)
-
-    with open(config_file, "w", encoding="utf-8") as f:
-        json.dump(config_dict, f, indent=2, ensure_ascii=False)
+    with open(config_file, "wb") as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
     print(f"\n✅ Configuration updated and saved to {config_file}")
 
@@ -159,8 +159,10 @@ async def quick_run_opencode():
 
     if config:
         # Clean selectors
-        for selection in config.selections:
-            selection.selector = selection.selector.replace(".crawler-highlight", "")
+        config.selections[:] = [
+            replace(s, selector=s.selector.replace(".crawler-highlight", ""))
+            for s in config.selections
+        ]
 
         # Quick test
         print("🧪 Running quick test...")